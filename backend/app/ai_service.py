@@ -1,249 +1,379 @@
-from mistralai.client import MistralClient
-from mistralai.models.chat_completion import ChatMessage
-import os
-from dotenv import load_dotenv
-from typing import Dict, List
-import json
-
-load_dotenv()
-
-class AIService:
-    def __init__(self):
-        self.client = MistralClient(api_key=os.getenv("MISTRAL_API_KEY"))
-        self.model = "mistral-large-latest"
-
-    def customize_resume(self, resume_text: str, job_description: str) -> str:
-        prompt = f"""
-        Please customize the following resume to better match the job description.
-        Focus on highlighting relevant skills and experiences.
-        Keep the same format but adjust the content to align with the job requirements.
-
-        Job Description:
-        {job_description}
-
-        Original Resume:
-        {resume_text}
-
-        Customized Resume:
-        """
-
-        messages = [
-            ChatMessage(role="user", content=prompt)
-        ]
-
-        response = self.client.chat(
-            model=self.model,
-            messages=messages,
-            temperature=0.7,
-            max_tokens=2000
-        )
-
-        return response.choices[0].message.content
-
-    def generate_cover_letter(self, resume_text: str, job_description: str, company_name: str) -> str:
-        prompt = f"""
-        Please write a compelling cover letter based on the following resume and job description.
-        The cover letter should be professional, highlight relevant skills, and show enthusiasm for the position.
-
-        Company: {company_name}
-
-        Job Description:
-        {job_description}
-
-        Resume:
-        {resume_text}
-
-        Cover Letter:
-        """
-
-        messages = [
-            ChatMessage(role="user", content=prompt)
-        ]
-
-        response = self.client.chat(
-            model=self.model,
-            messages=messages,
-            temperature=0.7,
-            max_tokens=2000
-        )
-
-        return response.choices[0].message.content
-
-    def analyze_job_fit(self, resume_text: str, job_description: str) -> Dict:
-        prompt = f"""
-        Please analyze how well the resume matches the job description.
-        Provide a score from 0-100 and specific recommendations for improvement.
-
-        Job Description:
-        {job_description}
-
-        Resume:
-        {resume_text}
-
-        Analysis:
-        """
-
-        messages = [
-            ChatMessage(role="user", content=prompt)
-        ]
-
-        response = self.client.chat(
-            model=self.model,
-            messages=messages,
-            temperature=0.7,
-            max_tokens=1000
-        )
-
-        return {
-            "analysis": response.choices[0].message.content,
-            "score": self._extract_score(response.choices[0].message.content)
-        }
-
-    def _extract_score(self, analysis: str) -> int:
-        # Simple score extraction - you might want to make this more sophisticated
-        try:
-            # Look for a number between 0 and 100 in the text
-            import re
-            numbers = re.findall(r'\b(?:100|[1-9]?[0-9])\b', analysis)
-            if numbers:
-                return int(numbers[0])
-            return 50  # Default score if no number found
-        except:
-            return 50  # Default score if extraction fails
-
-    def extract_resume_info(self, resume_text: str) -> Dict:
-        """Extract structured information from resume text."""
-        prompt = f"""
-        Extract structured information from the following resume text. 
-        Return a JSON object with the following structure:
-        {{
-            "full_name": "extracted name",
-            "email": "extracted email",
-            "phone": "extracted phone",
-            "linkedin": "extracted linkedin url or username",
-            "github": "extracted github url or username",
-            "address": "extracted address",
-            "summary": "professional summary or objective",
-            "education": [
-                {{"degree": "degree name", "school": "school name", "dates": "dates attended", "gpa": "if mentioned"}}
-            ],
-            "experience": [
-                {{"title": "job title", "company": "company name", "dates": "employment dates", "technologies": "tech stack used", "bullets": ["achievement 1", "achievement 2"]}}
-            ],
-            "skills": {{
-                "Languages": ["Python", "JavaScript", etc],
-                "Frameworks": ["React", "Django", etc],
-                "Databases": ["PostgreSQL", "MongoDB", etc],
-                "Tools": ["Git", "Docker", etc]
-            }},
-            "projects": [
-                {{"name": "project name", "technologies": "tech used", "date": "date", "bullets": ["description", "achievements"]}}
-            ],
-            "certifications": [
-                {{"name": "certification name", "issuer": "issuing organization", "date": "date"}}
-            ]
-        }}
-        
-        If any field is not found in the resume, use appropriate empty values (empty string for strings, empty arrays for arrays, empty objects for objects).
-        Make sure to categorize skills appropriately.
-        
-        Resume text:
-        {resume_text}
-        
-        JSON output:
-        """
-
-        messages = [
-            ChatMessage(role="user", content=prompt)
-        ]
-
-        try:
-            response = self.client.chat(
-                model=self.model,
-                messages=messages,
-                temperature=0.3,  # Lower temperature for more consistent extraction
-                max_tokens=2000
-            )
-            
-            # Extract JSON from response
-            response_text = response.choices[0].message.content
-            
-            # Try to find JSON in the response
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
-            if json_match:
-                json_str = json_match.group(0)
-                return json.loads(json_str)
-            else:
-                # If no JSON found, return empty structure
-                return self._empty_resume_structure()
-                
-        except Exception as e:
-            print(f"Error extracting resume info: {e}")
-            return self._empty_resume_structure()
-    
-    def _empty_resume_structure(self) -> Dict:
-        """Return empty resume structure."""
-        return {
-            "full_name": "",
-            "email": "",
-            "phone": "",
-            "linkedin": "",
-            "github": "",
-            "address": "",
-            "summary": "",
-            "education": [],
-            "experience": [],
-            "skills": {},
-            "projects": [],
-            "certifications": []
-        }
-
-    def generate_professional_summary(self, user_info: Dict, job_description: str, company: str) -> str:
-        """Generate a professional summary tailored to a specific job."""
-        prompt = f"""
-        Create a compelling professional summary (3-4 lines) for a resume tailored to this specific job.
-        
-        User background:
-        - Name: {user_info.get('full_name', 'Professional')}
-        - Current experience: {user_info.get('experience', [{}])[0].get('title', '')} if any
-        - Skills: {', '.join(user_info.get('skills', {}).get('Languages', [])[:3] + user_info.get('skills', {}).get('Frameworks', [])[:3])}
-        - Years of experience: {user_info.get('years_experience', 'several years')}
-        
-        Target Job:
-        Company: {company}
-        Job Description: {job_description[:500]}...
-        
-        Guidelines:
-        - Highlight relevant skills that match the job requirements
-        - Mention specific technologies if they align with the job
-        - Show enthusiasm for the company/role
-        - Be concise and impactful
-        - Use action words and quantify achievements where possible
-        
-        Professional Summary:
-        """
-        
-        messages = [
-            ChatMessage(role="user", content=prompt)
-        ]
-        
-        try:
-            response = self.client.chat(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=300
-            )
-            
-            summary = response.choices[0].message.content.strip()
-            # Remove any quotation marks or "Professional Summary:" prefix
-            summary = summary.replace('"', '').replace("'", '')
-            if summary.lower().startswith('professional summary:'):
-                summary = summary[20:].strip()
-            
-            return summary
-            
-        except Exception as e:
-            print(f"Error generating professional summary: {e}")
-            return "Experienced professional seeking to contribute technical expertise and drive innovation in a dynamic environment." 
\ No newline at end of file
+from mistralai.client import MistralClient
+from mistralai.models.chat_completion import ChatMessage
+import os
+from dotenv import load_dotenv
+from typing import Dict, Iterator, List
+import functools
+import hashlib
+import json
+import re
+import threading
+from cachetools import TTLCache
+import diskcache
+
+load_dotenv()
+
+# Structured resume extractions persist on disk; a user's resume rarely changes between applications
+RESUME_EXTRACT_CACHE_DIR = os.getenv("RESUME_EXTRACT_CACHE_DIR", os.path.join(".cache", "resume_extract"))
+RESUME_EXTRACT_TTL = 30 * 24 * 3600
+
+# First number between 0 and 100 in an analysis is taken as the score
+_SCORE_RE = re.compile(r'\b(?:100|[1-9]?[0-9])\b')
+
+# One MistralClient per process so every AIService shares its HTTP connection pool
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+def get_mistral_client() -> MistralClient:
+    """Return the shared MistralClient, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = MistralClient(api_key=os.getenv("MISTRAL_API_KEY"))
+    return _CLIENT
+
+# Static instructions go in the system message so the prompt prefix is identical across
+# calls and eligible for provider-side prefix caching; per-request data goes in the user message
+CUSTOMIZE_RESUME_INSTRUCTIONS = """Please customize the following resume to better match the job description.
+Focus on highlighting relevant skills and experiences.
+Keep the same format but adjust the content to align with the job requirements.
+Reply with the customized resume only."""
+
+COVER_LETTER_INSTRUCTIONS = """Please write a compelling cover letter based on the following resume and job description.
+The cover letter should be professional, highlight relevant skills, and show enthusiasm for the position.
+Reply with the cover letter only."""
+
+JOB_FIT_INSTRUCTIONS = """Please analyze how well the resume matches the job description.
+Provide a score from 0-100 and specific recommendations for improvement."""
+
+GENERATE_ALL_INSTRUCTIONS = """Using the resume and job description provided, produce all of the following:
+1. "resume": the resume customized to better match the job description. Keep the same format,
+   but highlight relevant skills and experiences and align the content with the job requirements.
+2. "cover_letter": a compelling cover letter that is professional, highlights relevant skills
+   and shows enthusiasm for the position.
+3. "analysis": how well the resume matches the job description, with specific recommendations for improvement.
+4. "score": a match score from 0-100.
+
+Return only a JSON object with exactly these keys:
+{"resume": "...", "cover_letter": "...", "analysis": "...", "score": 0}"""
+
+RESUME_EXTRACTION_INSTRUCTIONS = """Extract structured information from the resume text provided.
+Return a JSON object with the following structure:
+{
+    "full_name": "extracted name",
+    "email": "extracted email",
+    "phone": "extracted phone",
+    "linkedin": "extracted linkedin url or username",
+    "github": "extracted github url or username",
+    "address": "extracted address",
+    "summary": "professional summary or objective",
+    "education": [
+        {"degree": "degree name", "school": "school name", "dates": "dates attended", "gpa": "if mentioned"}
+    ],
+    "experience": [
+        {"title": "job title", "company": "company name", "dates": "employment dates", "technologies": "tech stack used", "bullets": ["achievement 1", "achievement 2"]}
+    ],
+    "skills": {
+        "Languages": ["Python", "JavaScript", etc],
+        "Frameworks": ["React", "Django", etc],
+        "Databases": ["PostgreSQL", "MongoDB", etc],
+        "Tools": ["Git", "Docker", etc]
+    },
+    "projects": [
+        {"name": "project name", "technologies": "tech used", "date": "date", "bullets": ["description", "achievements"]}
+    ],
+    "certifications": [
+        {"name": "certification name", "issuer": "issuing organization", "date": "date"}
+    ]
+}
+
+If any field is not found in the resume, use appropriate empty values (empty string for strings, empty arrays for arrays, empty objects for objects).
+Make sure to categorize skills appropriately."""
+
+PROFESSIONAL_SUMMARY_INSTRUCTIONS = """Create a compelling professional summary (3-4 lines) for a resume tailored to the target job.
+
+Guidelines:
+- Highlight relevant skills that match the job requirements
+- Mention specific technologies if they align with the job
+- Show enthusiasm for the company/role
+- Be concise and impactful
+- Use action words and quantify achievements where possible"""
+
+def _chat_messages(instructions: str, content: str) -> List[ChatMessage]:
+    """Static instructions as the system message, request data as the user message."""
+    return [
+        ChatMessage(role="system", content=instructions),
+        ChatMessage(role="user", content=content)
+    ]
+
+def text_hash(text: str) -> str:
+    """Stable BLAKE2b digest used to key cached LLM results."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _parse_json_object(response_text: str) -> Dict:
+    """Pull the first JSON object out of a model response that may wrap it in prose."""
+    start = response_text.find('{')
+    while start != -1:
+        try:
+            result, _ = _JSON_DECODER.raw_decode(response_text, start)
+            if isinstance(result, dict):
+                return result
+        except json.JSONDecodeError:
+            pass
+        start = response_text.find('{', start + 1)
+    raise ValueError("No JSON object found in model response")
+
+def _llm_cache_key(name: str, resume_text: str, args: tuple, model: str) -> tuple:
+    """Key for a cached LLM result: (call, resume hash, remaining inputs hash, model)."""
+    # JSON keeps the inputs apart; joining them on a separator would let ("a|b", "c") collide with ("a", "b|c")
+    return (name, text_hash(resume_text), text_hash(json.dumps(args)), model)
+
+def _memoize_llm(method):
+    """Cache an AIService LLM call on (resume text, remaining inputs, model)."""
+    @functools.wraps(method)
+    def wrapper(self, resume_text: str, *args):
+        key = _llm_cache_key(method.__name__, resume_text, args, self.model)
+        return self._cached(key, lambda: method(self, resume_text, *args))
+    return wrapper
+
+class AIService:
+    def __init__(self, model: str = "mistral-large-latest", extraction_model: str = "mistral-small-latest"):
+        self.client = get_mistral_client()
+        # Writing tasks (resume, cover letter, analysis) use the larger model
+        self.model = model
+        # Resume extraction is constrained JSON output, which a smaller, faster model handles well
+        self.extraction_model = extraction_model
+        # Completed LLM results, so repeated (resume, job) pairs skip the Mistral round-trip
+        self._cache = TTLCache(maxsize=512, ttl=3600)
+        self._cache_lock = threading.RLock()
+        self._extract_cache = diskcache.Cache(RESUME_EXTRACT_CACHE_DIR)
+
+    def _cached(self, key: tuple, fn):
+        """Return the cached result for key, calling fn on a miss."""
+        with self._cache_lock:
+            if key in self._cache:
+                return self._cache[key]
+        # Don't hold the lock across the network call
+        result = fn()
+        with self._cache_lock:
+            self._cache[key] = result
+        return result
+
+    def _customize_resume_messages(self, resume_text: str, job_description: str) -> List[ChatMessage]:
+        return _chat_messages(
+            CUSTOMIZE_RESUME_INSTRUCTIONS,
+            f"Job Description:\n{job_description}\n\nOriginal Resume:\n{resume_text}"
+        )
+
+    @_memoize_llm
+    def customize_resume(self, resume_text: str, job_description: str) -> str:
+        response = self.client.chat(
+            model=self.model,
+            messages=self._customize_resume_messages(resume_text, job_description),
+            temperature=0.7,
+            max_tokens=2000
+        )
+
+        return response.choices[0].message.content
+
+    def customize_resume_stream(self, resume_text: str, job_description: str) -> Iterator[str]:
+        """Yield the customized resume chunk by chunk as the model generates it."""
+        key = _llm_cache_key('customize_resume', resume_text, (job_description,), self.model)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for chunk in self.client.chat_stream(
+            model=self.model,
+            messages=self._customize_resume_messages(resume_text, job_description),
+            temperature=0.7,
+            max_tokens=2000
+        ):
+            content = chunk.choices[0].delta.content
+            if content:
+                chunks.append(content)
+                yield content
+
+        # Only a fully streamed response is shared with customize_resume()
+        with self._cache_lock:
+            self._cache[key] = ''.join(chunks)
+
+    @_memoize_llm
+    def generate_cover_letter(self, resume_text: str, job_description: str, company_name: str) -> str:
+        messages = _chat_messages(
+            COVER_LETTER_INSTRUCTIONS,
+            f"Company: {company_name}\n\nJob Description:\n{job_description}\n\nResume:\n{resume_text}"
+        )
+
+        response = self.client.chat(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=2000
+        )
+
+        return response.choices[0].message.content
+
+    @_memoize_llm
+    def analyze_job_fit(self, resume_text: str, job_description: str) -> Dict:
+        messages = _chat_messages(
+            JOB_FIT_INSTRUCTIONS,
+            f"Job Description:\n{job_description}\n\nResume:\n{resume_text}"
+        )
+
+        response = self.client.chat(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=1000
+        )
+
+        return {
+            "analysis": response.choices[0].message.content,
+            "score": self._extract_score(response.choices[0].message.content)
+        }
+
+    def generate_all(self, resume_text: str, job_description: str, company_name: str) -> Dict:
+        """Customized resume, cover letter and fit analysis from a single model call."""
+        try:
+            return self._request_all(resume_text, job_description, company_name)
+        except (ValueError, KeyError) as e:
+            print(f"Combined generation failed, falling back to separate calls: {e}")
+            fit = self.analyze_job_fit(resume_text, job_description)
+            return {
+                "resume": self.customize_resume(resume_text, job_description),
+                "cover_letter": self.generate_cover_letter(resume_text, job_description, company_name),
+                "analysis": fit["analysis"],
+                "score": fit["score"]
+            }
+
+    @_memoize_llm
+    def _request_all(self, resume_text: str, job_description: str, company_name: str) -> Dict:
+        """Send the combined prompt; raises when the reply is not the expected JSON."""
+        messages = _chat_messages(
+            GENERATE_ALL_INSTRUCTIONS,
+            f"Company: {company_name}\n\nJob Description:\n{job_description}\n\nResume:\n{resume_text}"
+        )
+
+        response = self.client.chat(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=5000
+        )
+
+        result = _parse_json_object(response.choices[0].message.content)
+        analysis = str(result["analysis"])
+        try:
+            score = max(0, min(100, int(result.get("score"))))
+        except (TypeError, ValueError):
+            score = self._extract_score(analysis)
+        return {
+            "resume": str(result["resume"]),
+            "cover_letter": str(result["cover_letter"]),
+            "analysis": analysis,
+            "score": score
+        }
+
+    def _extract_score(self, analysis: str) -> int:
+        # Simple score extraction - you might want to make this more sophisticated
+        try:
+            # Look for a number between 0 and 100 in the text
+            match = _SCORE_RE.search(analysis)
+            return int(match.group()) if match else 50  # Default score if no number found
+        except:
+            return 50  # Default score if extraction fails
+
+    def extract_resume_info(self, resume_text: str) -> Dict:
+        """Extract structured information from resume text."""
+        key = f"{text_hash(resume_text)}:{self.extraction_model}"
+        cached = self._extract_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            resume_info = self._request_resume_info(resume_text)
+        except Exception as e:
+            print(f"Error extracting resume info: {e}")
+            return self._empty_resume_structure()
+        self._extract_cache.set(key, resume_info, expire=RESUME_EXTRACT_TTL)
+        return resume_info
+
+    def _request_resume_info(self, resume_text: str) -> Dict:
+        """Ask the model for the structured resume; raises instead of caching a failed extraction."""
+        messages = _chat_messages(RESUME_EXTRACTION_INSTRUCTIONS, f"Resume text:\n{resume_text}")
+
+        response = self.client.chat(
+            model=self.extraction_model,
+            messages=messages,
+            temperature=0.0,  # Deterministic output for consistent extraction
+            max_tokens=1200
+        )
+        
+        # Extract JSON from response
+        response_text = response.choices[0].message.content
+        
+        return _parse_json_object(response_text)
+    
+    def _empty_resume_structure(self) -> Dict:
+        """Return empty resume structure."""
+        return {
+            "full_name": "",
+            "email": "",
+            "phone": "",
+            "linkedin": "",
+            "github": "",
+            "address": "",
+            "summary": "",
+            "education": [],
+            "experience": [],
+            "skills": {},
+            "projects": [],
+            "certifications": []
+        }
+
+    def generate_professional_summary(self, user_info: Dict, job_description: str, company: str) -> str:
+        """Generate a professional summary tailored to a specific job."""
+        prompt = f"""
+        User background:
+        - Name: {user_info.get('full_name', 'Professional')}
+        - Current experience: {user_info.get('experience', [{}])[0].get('title', '')} if any
+        - Skills: {', '.join(user_info.get('skills', {}).get('Languages', [])[:3] + user_info.get('skills', {}).get('Frameworks', [])[:3])}
+        - Years of experience: {user_info.get('years_experience', 'several years')}
+        
+        Target Job:
+        Company: {company}
+        Job Description: {job_description[:500]}...
+        """
+        
+        # The prompt holds every input the summary depends on
+        key = _llm_cache_key('generate_professional_summary', prompt, (), self.model)
+        try:
+            return self._cached(key, lambda: self._request_professional_summary(prompt))
+        except Exception as e:
+            print(f"Error generating professional summary: {e}")
+            return "Experienced professional seeking to contribute technical expertise and drive innovation in a dynamic environment."
+
+    def _request_professional_summary(self, prompt: str) -> str:
+        """Ask the model for the summary; raises instead of caching the generic fallback."""
+        messages = _chat_messages(PROFESSIONAL_SUMMARY_INSTRUCTIONS, prompt)
+        
+        response = self.client.chat(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=300
+        )
+        
+        summary = response.choices[0].message.content.strip()
+        # Remove any quotation marks or "Professional Summary:" prefix
+        summary = summary.replace('"', '').replace("'", '')
+        if summary.lower().startswith('professional summary:'):
+            summary = summary[20:].strip()
+        
+        return summary
\ No newline at end of file
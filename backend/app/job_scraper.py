@@ -1,896 +1,1197 @@
-import asyncio
-import aiohttp
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-import json
-import time
-import re
-from datetime import datetime, timedelta
-from urllib.parse import quote_plus, urlparse, urlencode
-from dataclasses import dataclass, asdict
-from functools import lru_cache
-import random
-import logging
-import html
-from email.utils import parsedate_to_datetime
-import hashlib
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Helper function for flexible date parsing
-def parse_date_flexible(date_str: Optional[str]) -> str:
-    """Tries to parse a date string from common formats."""
-    if not date_str:
-        return datetime.now().strftime('%Y-%m-%d')
-    
-    # Handle relative dates
-    date_str_lower = date_str.lower()
-    if 'today' in date_str_lower or 'just now' in date_str_lower:
-        return datetime.now().strftime('%Y-%m-%d')
-    elif 'yesterday' in date_str_lower:
-        return (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-    elif 'days ago' in date_str_lower:
-        match = re.search(r'(\d+)\s*days?\s*ago', date_str_lower)
-        if match:
-            days = int(match.group(1))
-            return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    elif 'weeks ago' in date_str_lower:
-        match = re.search(r'(\d+)\s*weeks?\s*ago', date_str_lower)
-        if match:
-            weeks = int(match.group(1))
-            return (datetime.now() - timedelta(weeks=weeks)).strftime('%Y-%m-%d')
-    elif 'months ago' in date_str_lower:
-        match = re.search(r'(\d+)\s*months?\s*ago', date_str_lower)
-        if match:
-            months = int(match.group(1))
-            return (datetime.now() - timedelta(days=months*30)).strftime('%Y-%m-%d')
-    
-    # Attempt 1: ISO 8601 (e.g., "2023-10-26T15:00:00Z" or "2023-10-26 15:00:00")
-    try:
-        temp_date_str = date_str
-        if temp_date_str.endswith('Z'):
-            temp_date_str = temp_date_str[:-1] + '+00:00'
-        # Replace space with T if it's likely ISO format without T
-        if ' ' in temp_date_str and 'T' not in temp_date_str and temp_date_str.count(':') >= 2:
-             parts = temp_date_str.split(' ')
-             if len(parts) == 2 and '-' in parts[0] and ':' in parts[1]:
-                temp_date_str = 'T'.join(parts)
-        
-        dt_obj = datetime.fromisoformat(temp_date_str)
-        return dt_obj.strftime('%Y-%m-%d')
-    except ValueError:
-        pass
-
-    # Attempt 2: RFC 822 (common in RSS, e.g., "Wed, 02 Oct 2002 08:00:00 EST")
-    try:
-        dt_obj = parsedate_to_datetime(date_str)
-        return dt_obj.strftime('%Y-%m-%d')
-    except (TypeError, ValueError):
-        pass
-        
-    # Attempt 3: Other common formats (add as needed)
-    common_manual_formats = [
-        '%Y-%m-%d %H:%M:%S',
-        '%b %d, %Y', # Jan 01, 2023
-        '%d %b %Y',   # 01 Jan 2023
-        '%m/%d/%Y',   # 01/01/2023
-        '%B %d, %Y', # January 01, 2023
-        '%d/%m/%Y',   # 01/01/2023 (European format)
-    ]
-    for fmt in common_manual_formats:
-        try:
-            dt_obj = datetime.strptime(date_str, fmt)
-            return dt_obj.strftime('%Y-%m-%d')
-        except ValueError:
-            continue
-            
-    logger.warning(f"Could not parse date: '{date_str}'. Using current date.")
-    return datetime.now().strftime('%Y-%m-%d')
-
-@dataclass
-class JobPosting:
-    """Enhanced job posting data structure."""
-    id: str
-    title: str
-    company: str
-    location: str
-    description: str
-    requirements: List[str]
-    technologies: List[str]
-    salary_range: Optional[str]
-    experience_level: str  # junior, mid, senior
-    remote_friendly: bool
-    visa_sponsorship: bool
-    posted_date: str
-    source: str
-    url: str
-    relevance_score: float  # 0-100 match to search
-    job_type: Optional[str] = None  # full-time, part-time, contract, etc.
-    benefits: Optional[List[str]] = None
-
-    def to_dict(self) -> Dict:
-        return asdict(self)
-
-class JobScraper:
-    """Improved job scraper with multiple sources and fallbacks."""
-    
-    def __init__(self):
-        self.session = requests.Session()
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/120.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15'
-        ]
-        self.session.headers.update({'User-Agent': random.choice(self.user_agents)})
-        
-        # Technology synonyms for better matching
-        self.tech_synonyms = {
-            'javascript': ['js', 'javascript', 'node', 'nodejs', 'ecmascript'],
-            'python': ['python', 'py', 'django', 'flask', 'fastapi', 'pandas', 'numpy'],
-            'react': ['react', 'reactjs', 'react.js', 'redux'],
-            'angular': ['angular', 'angularjs', 'angular.js'],
-            'vue': ['vue', 'vuejs', 'vue.js', 'nuxt'],
-            'java': ['java', 'spring', 'springboot', 'hibernate', 'jvm'],
-            'golang': ['go', 'golang'],
-            'csharp': ['c#', 'csharp', '.net', 'dotnet', 'asp.net'],
-            'php': ['php', 'laravel', 'symfony', 'wordpress'],
-            'ruby': ['ruby', 'rails', 'rubyonrails', 'ror'],
-            'swift': ['swift', 'ios', 'swiftui'],
-            'kotlin': ['kotlin', 'android'],
-            'typescript': ['typescript', 'ts'],
-            'rust': ['rust', 'rustlang'],
-            'database': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch'],
-            'cloud': ['aws', 'azure', 'gcp', 'cloud', 'devops'],
-            'container': ['docker', 'kubernetes', 'k8s', 'containerization']
-        }
-
-    def get_random_user_agent(self) -> str:
-        """Get a random user agent to avoid blocking."""
-        return random.choice(self.user_agents)
-
-    def clean_text(self, text: str) -> str:
-        """Clean and normalize text."""
-        if not text:
-            return ""
-        
-        # Unescape HTML entities first
-        text = html.unescape(text)
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', text)
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\-\.,!?()]+', '', text)
-        # Trim and limit length
-        text = text.strip()
-        if len(text) > 1000:
-            text = text[:997] + '...'
-        return text
-
-    def extract_salary_range(self, text: str) -> Optional[str]:
-        """Extract salary range from job text."""
-        # Look for salary patterns
-        salary_patterns = [
-            r'\$[\d,]+\s*-\s*\$[\d,]+',  # $100,000 - $150,000
-            r'\$[\d,]+k?\s*-\s*\$[\d,]+k?',  # $100k - $150k
-            r'[\d,]+\s*-\s*[\d,]+\s*(?:USD|EUR|GBP)',  # 100,000 - 150,000 USD
-            r'€[\d,]+\s*-\s*€[\d,]+',  # €100,000 - €150,000
-            r'£[\d,]+\s*-\s*£[\d,]+',  # £100,000 - £150,000
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        return None
-
-    def extract_technologies(self, text: str) -> List[str]:
-        """Extract technologies from job text."""
-        text_lower = text.lower()
-        found_techs = set()
-        
-        # Extended list of technologies to look for
-        technologies = [
-            'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node.js', 'nodejs',
-            'django', 'flask', 'fastapi', 'spring', 'typescript', 'php', 'ruby', 'rails',
-            'go', 'golang', 'rust', 'c++', 'c#', '.net', 'sql', 'postgresql', 'mysql',
-            'mongodb', 'redis', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform',
-            'git', 'linux', 'html', 'css', 'sass', 'webpack', 'jenkins', 'graphql',
-            'elasticsearch', 'kafka', 'rabbitmq', 'nginx', 'apache', 'pandas', 'numpy',
-            'tensorflow', 'pytorch', 'scikit-learn', 'spark', 'hadoop', 'scala', 'kotlin',
-            'swift', 'objective-c', 'flutter', 'xamarin', 'unity', 'unreal', 'matlab',
-            'r', 'sas', 'tableau', 'power bi', 'excel', 'jira', 'confluence', 'slack'
-        ]
-        
-        for tech in technologies:
-            if tech.lower() in text_lower:
-                found_techs.add(tech.title())
-        
-        return list(found_techs)[:15]  # Limit to 15 technologies
-
-    def extract_benefits(self, text: str) -> List[str]:
-        """Extract benefits from job description."""
-        text_lower = text.lower()
-        benefits = []
-        
-        benefit_keywords = {
-            'health insurance': ['health insurance', 'medical insurance', 'healthcare', 'medical coverage'],
-            'dental insurance': ['dental insurance', 'dental coverage', 'dental plan'],
-            'vision insurance': ['vision insurance', 'vision coverage', 'vision plan'],
-            '401k': ['401k', '401(k)', 'retirement plan', 'pension'],
-            'paid time off': ['pto', 'paid time off', 'vacation days', 'holiday pay'],
-            'remote work': ['remote work', 'work from home', 'wfh', 'telecommute'],
-            'flexible hours': ['flexible hours', 'flex time', 'flexible schedule'],
-            'stock options': ['stock options', 'equity', 'espp', 'rsu'],
-            'bonus': ['bonus', 'performance bonus', 'annual bonus'],
-            'parental leave': ['parental leave', 'maternity leave', 'paternity leave'],
-            'professional development': ['professional development', 'training budget', 'conference budget'],
-            'gym membership': ['gym membership', 'fitness benefit', 'wellness program']
-        }
-        
-        for benefit, keywords in benefit_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                benefits.append(benefit)
-        
-        return benefits[:8]  # Limit to 8 benefits
-
-    def detect_job_type(self, text: str) -> str:
-        """Detect job type from text."""
-        text_lower = text.lower()
-        
-        if any(term in text_lower for term in ['full-time', 'full time', 'ft']):
-            return 'Full-time'
-        elif any(term in text_lower for term in ['part-time', 'part time', 'pt']):
-            return 'Part-time'
-        elif any(term in text_lower for term in ['contract', 'contractor', 'freelance']):
-            return 'Contract'
-        elif any(term in text_lower for term in ['internship', 'intern']):
-            return 'Internship'
-        elif any(term in text_lower for term in ['temporary', 'temp']):
-            return 'Temporary'
-        else:
-            return 'Full-time'  # Default
-
-    def detect_experience_level(self, title: str, description: str) -> str:
-        text = f"{title} {description}".lower()
-        # Frontend options for reference: const experienceLevels = ["Entry-level", "Junior", "Mid-level", "Senior", "Lead", "Principal"];
-        # Order matters: check from most senior/specific to most junior/general.
-
-        # Principal
-        principal_kws = ['principal engineer', 'principal software engineer', 'principal architect', 'principal consultant']
-        if any(kw in text for kw in principal_kws):
-            return "Principal"
-
-        # Lead
-        lead_kws = ['lead engineer', 'tech lead', 'team lead', 'lead developer', 'development lead', 'engineering lead']
-        if any(kw in text for kw in lead_kws):
-            return "Lead"
-        
-        # Senior
-        senior_kws = ['senior', 'sr.', 'sr ', 'staff engineer', 'architect', # Architect often implies senior
-                      'manager', 'director', 'expert', 'head of', 
-                      '7+ years', '8+ years', '9+ years', '10+ years', '10+ yrs', '7+ yrs', 'seven years', 'eight years', 'ten years']
-        if any(kw in text for kw in senior_kws):
-            return "Senior"
-
-        # Mid-level
-        # Note: 'software engineer' without other qualifiers often implies mid-level. This is hard with keywords alone.
-        mid_kws = ['mid-level', 'mid level', 'intermediate', 'mid-senior', 
-                   '3-5 years', '4-6 years', '5-7 years', '3+ years', '3+ yrs', 'three years', 'four years', 'five years',
-                   'engineer ii', 'developer ii']
-        if any(kw in text for kw in mid_kws):
-            return "Mid-level"
-
-        # Junior - check before entry if specific junior terms are present and not entry terms
-        junior_kws = ['junior', 'jr.', 'jr ', 'associate software engineer', 'associate developer', 
-                      '1-3 years', '1-2 yrs', '2-3 years', 'one year', 'two years', 'three years experience', # "three years" could be mid, context matters
-                      'engineer i', 'developer i']
-        
-        # Entry-level - has more specific terms like intern, graduate
-        entry_kws = ['entry-level', 'entry level', 'graduate', 'new grad', 'graduating',
-                     'intern', 'internship', 'trainee', 
-                     '0-1 year', '0-2 years', '<1 year', '<2 years', 'no experience required', 'recent graduate']
-
-        has_junior_term = any(kw in text for kw in junior_kws)
-        has_entry_term = any(kw in text for kw in entry_kws)
-
-        if has_entry_term: # Prioritize "Entry-level" if its specific keywords are found
-            return "Entry-level"
-        if has_junior_term: # If no entry-specific terms, but junior terms, then "Junior"
-            return "Junior"
-        
-        # Fallback title checks (less reliable than full text but good for some cases)
-        # These are checked if the above keyword checks on full text didn't return.
-        title_lower = title.lower()
-        if 'principal' in title_lower: return "Principal"
-        if 'lead' in title_lower: return "Lead"
-        if 'senior' in title_lower or 'sr ' in title_lower: return "Senior"
-        # Check for mid-level in title if possible, though less common as explicit term
-        if 'mid-level' in title_lower or 'mid level' in title_lower: return "Mid-level"
-        if 'junior' in title_lower or 'jr ' in title_lower: return "Junior"
-        if 'entry' in title_lower or 'intern' in title_lower or 'graduate' in title_lower : return "Entry-level"
-        
-        # Default if nothing clearly matches after all checks
-        return "Mid-level"
-
-    def detect_remote_friendly(self, location: str, description: str) -> bool:
-        """Detect if job is remote-friendly."""
-        text = f"{location} {description}".lower()
-        remote_indicators = ['remote', 'work from home', 'distributed', 'anywhere', 
-                           'telecommute', 'wfh', 'virtual', 'home office', 'remote-first']
-        return any(indicator in text for indicator in remote_indicators)
-
-    def detect_visa_sponsorship(self, description: str) -> bool:
-        """Detect if job offers visa sponsorship."""
-        text = description.lower()
-        visa_indicators = [
-            'visa sponsorship', 'h1b', 'h-1b', 'work permit', 'immigration support',
-            'international candidates', 'work authorization', 'sponsor visa',
-            'visa assistance', 'green card', 'employment authorization'
-        ]
-        
-        # Also check for negative indicators
-        no_visa_indicators = [
-            'no visa sponsorship', 'cannot sponsor', 'unable to sponsor',
-            'must be authorized', 'must have work authorization',
-            'citizen or permanent resident'
-        ]
-        
-        if any(indicator in text for indicator in no_visa_indicators):
-            return False
-        
-        return any(indicator in text for indicator in visa_indicators)
-
-    def calculate_relevance_score(self, job_text: str, keywords: str) -> float:
-        """Calculate relevance score between job and search keywords."""
-        job_text_lower = job_text.lower()
-        keywords_lower = keywords.lower()
-        
-        # Define conflicting terms - if user searches for one, exclude the others
-        experience_conflicts = {
-            'junior': ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of'],
-            'entry': ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of', 'mid-level', 'experienced'],
-            'entry-level': ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of', 'mid-level', 'experienced'],
-            'intern': ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of', 'mid-level', 'experienced'],
-            'senior': ['junior', 'entry', 'entry-level', 'intern', 'trainee', 'graduate'],
-            'lead': ['junior', 'entry', 'entry-level', 'intern', 'trainee', 'graduate'],
-            'principal': ['junior', 'entry', 'entry-level', 'intern', 'trainee', 'graduate', 'mid-level'],
-        }
-        
-        # Add job type conflicts
-        job_type_conflicts = {
-            'full-time': ['part-time', 'contract', 'freelance', 'temporary', 'intern'],
-            'part-time': ['full-time'],
-            'contract': ['full-time', 'permanent'],
-            'freelance': ['full-time', 'permanent'],
-            'permanent': ['contract', 'freelance', 'temporary'],
-            'remote': ['on-site only', 'in-office only'],
-        }
-        
-        # Check for conflicting terms
-        for search_term, conflicts in experience_conflicts.items():
-            if search_term in keywords_lower:
-                # If any conflicting term is found in the job text, return 0 score
-                for conflict in conflicts:
-                    if conflict in job_text_lower:
-                        return 0.0
-        
-        # Check job type conflicts
-        for search_term, conflicts in job_type_conflicts.items():
-            if search_term in keywords_lower:
-                for conflict in conflicts:
-                    if conflict in job_text_lower:
-                        return 0.0
-        
-        # Split keywords by common delimiters
-        keyword_list = re.split(r'[,\s]+', keywords_lower)
-        keyword_list = [k.strip() for k in keyword_list if k.strip()]
-        
-        score = 0.0
-        total_keywords = len(keyword_list)
-        
-        for keyword in keyword_list:
-            if not keyword:
-                continue
-                
-            # Direct match
-            if keyword in job_text_lower:
-                score += 20.0
-            
-            # Check synonyms
-            for tech, synonyms in self.tech_synonyms.items():
-                if keyword in synonyms and any(syn in job_text_lower for syn in synonyms):
-                    score += 15.0
-                    break
-            
-            # Partial match (only for longer keywords to avoid false positives)
-            if len(keyword) > 3:
-                keyword_parts = keyword.split()
-                if any(part in job_text_lower for part in keyword_parts if len(part) > 3):
-                    score += 5.0
-        
-        # Normalize score
-        max_possible_score = total_keywords * 20.0
-        if max_possible_score > 0:
-            score = min(100.0, (score / max_possible_score) * 100)
-        
-        return round(score, 1)
-
-    @lru_cache(maxsize=100)
-    def scrape_remoteok(self, keywords: str, max_jobs: int = 10) -> List[JobPosting]:
-        """Scrape RemoteOK API - most reliable source."""
-        jobs = []
-        try:
-            logger.info("Scraping RemoteOK...")
-            url = "https://remoteok.com/api"
-            headers = {'User-Agent': self.get_random_user_agent()}
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Skip first item (metadata)
-            job_data = data[1:] if isinstance(data, list) and len(data) > 1 else data
-            
-            for job in job_data:
-                if not isinstance(job, dict) or len(jobs) >= max_jobs:
-                    continue
-                
-                title = job.get('position', '').strip()
-                company = job.get('company', '').strip()
-                description = job.get('description', '').strip()
-                
-                if not title or not company:
-                    continue
-                
-                # Calculate relevance
-                job_text = f"{title} {company} {description}"
-                relevance = self.calculate_relevance_score(job_text, keywords)
-                
-                # Only include relevant jobs
-                if relevance < 20:
-                    continue
-                
-                # Extract salary
-                salary_min = job.get('salary_min')
-                salary_max = job.get('salary_max')
-                salary_range = None
-                if salary_min and salary_max:
-                    salary_range = f"${salary_min:,} - ${salary_max:,}"
-                
-                job_posting = JobPosting(
-                    id=f"remoteok_{job.get('id', len(jobs))}",
-                    title=title,
-                    company=company,
-                    location='Remote',
-                    description=self.clean_text(description),
-                    requirements=job.get('tags', [])[:5] if job.get('tags') else [],
-                    technologies=self.extract_technologies(job_text),
-                    salary_range=salary_range,
-                    experience_level=self.detect_experience_level(title, description),
-                    remote_friendly=True,
-                    visa_sponsorship=self.detect_visa_sponsorship(description),
-                    posted_date=parse_date_flexible(job.get('date')),
-                    source='RemoteOK',
-                    url=job.get('url', ''),
-                    relevance_score=relevance,
-                    job_type='Full-time',
-                    benefits=['Remote work', 'Flexible hours']
-                )
-                jobs.append(job_posting)
-                
-        except Exception as e:
-            logger.error(f"Error scraping RemoteOK: {e}")
-        
-        return jobs
-
-    def scrape_linkedin(self, keywords: str, location: str = "", max_jobs: int = 10) -> List[JobPosting]:
-        """Scrape LinkedIn jobs (limited without login)."""
-        jobs = []
-        try:
-            logger.info("Scraping LinkedIn jobs...")
-            
-            # LinkedIn public job search URL
-            params = {
-                'keywords': keywords,
-                'location': location or 'United States',
-                'f_TPR': 'r86400',  # Past 24 hours
-                'position': 1,
-                'pageNum': 0
-            }
-            
-            base_url = 'https://www.linkedin.com/jobs/search'
-            url = f"{base_url}?{urlencode(params)}"
-            
-            headers = {
-                'User-Agent': self.get_random_user_agent(),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_cards = soup.find_all('div', class_='base-card')[:max_jobs]
-            
-            for i, card in enumerate(job_cards):
-                try:
-                    # Extract job details
-                    title_elem = card.find('h3', class_='base-search-card__title')
-                    company_elem = card.find('h4', class_='base-search-card__subtitle')
-                    location_elem = card.find('span', class_='job-search-card__location')
-                    link_elem = card.find('a', class_='base-card__full-link')
-                    
-                    if not all([title_elem, company_elem, link_elem]):
-                        continue
-                    
-                    title = title_elem.text.strip()
-                    company = company_elem.text.strip()
-                    job_location = location_elem.text.strip() if location_elem else location
-                    job_url = link_elem.get('href', '')
-                    
-                    # Extract time posted
-                    time_elem = card.find('time')
-                    posted_date = parse_date_flexible(time_elem.get('datetime', '') if time_elem else '')
-                    
-                    # Create job description from available info
-                    description = f"{title} position at {company} in {job_location}. "
-                    
-                    # Extract any additional metadata
-                    metadata_elem = card.find('div', class_='base-search-card__metadata')
-                    if metadata_elem:
-                        description += metadata_elem.text.strip()
-                    
-                    job_text = f"{title} {company} {description}"
-                    relevance = self.calculate_relevance_score(job_text, keywords)
-                    
-                    if relevance < 15:
-                        continue
-                    
-                    job_posting = JobPosting(
-                        id=f"linkedin_{hashlib.md5(job_url.encode()).hexdigest()[:8]}",
-                        title=title,
-                        company=company,
-                        location=job_location,
-                        description=self.clean_text(description),
-                        requirements=self.extract_technologies(job_text)[:5],
-                        technologies=self.extract_technologies(job_text),
-                        salary_range=self.extract_salary_range(description),
-                        experience_level=self.detect_experience_level(title, description),
-                        remote_friendly=self.detect_remote_friendly(job_location, description),
-                        visa_sponsorship=self.detect_visa_sponsorship(description),
-                        posted_date=posted_date,
-                        source='LinkedIn',
-                        url=job_url,
-                        relevance_score=relevance,
-                        job_type=self.detect_job_type(description),
-                        benefits=self.extract_benefits(description)
-                    )
-                    jobs.append(job_posting)
-                    
-                except Exception as e:
-                    logger.debug(f"Error parsing LinkedIn job card: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error scraping LinkedIn: {e}")
-        
-        return jobs
-
-    def scrape_indeed(self, keywords: str, location: str = "", max_jobs: int = 10) -> List[JobPosting]:
-        """Scrape Indeed jobs."""
-        jobs = []
-        try:
-            logger.info("Scraping Indeed jobs...")
-            
-            # Indeed search URL
-            params = {
-                'q': keywords,
-                'l': location or 'United States',
-                'fromage': '7',  # Jobs from last 7 days
-                'sort': 'date'
-            }
-            
-            url = f"https://www.indeed.com/jobs?{urlencode(params)}"
-            
-            headers = {
-                'User-Agent': self.get_random_user_agent(),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Indeed uses different class names periodically, try multiple selectors
-            job_cards = soup.find_all('div', class_='job_seen_beacon') or \
-                       soup.find_all('div', class_='jobsearch-SerpJobCard') or \
-                       soup.find_all('div', class_='slider_container')
-            
-            job_cards = job_cards[:max_jobs]
-            
-            for i, card in enumerate(job_cards):
-                try:
-                    # Extract job details with multiple selector attempts
-                    title_elem = card.find('h2', class_='jobTitle') or \
-                                card.find('a', {'data-testid': 'job-title'}) or \
-                                card.find('span', {'title': True})
-                    
-                    company_elem = card.find('div', {'data-testid': 'company-name'}) or \
-                                  card.find('span', class_='companyName') or \
-                                  card.find('a', {'data-testid': 'company-name'})
-                    
-                    location_elem = card.find('div', {'data-testid': 'job-location'}) or \
-                                   card.find('div', class_='locationsContainer') or \
-                                   card.find('span', class_='location')
-                    
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.text.strip()
-                    company = company_elem.text.strip() if company_elem else 'Company'
-                    job_location = location_elem.text.strip() if location_elem else location
-                    
-                    # Build job URL
-                    link_elem = card.find('a', href=True)
-                    if link_elem and link_elem.get('href'):
-                        job_url = f"https://www.glassdoor.com{link_elem['href']}" if link_elem['href'].startswith('/') else link_elem['href']
-                    else:
-                        job_url = url
-                    
-                    # Create description
-                    description = f"{title} position at {company} in {job_location}."
-                    
-                    # Extract salary if available
-                    salary_elem = card.find('span', class_='salary-estimate') or \
-                                 card.find('span', {'data-test': 'detailSalary'})
-                    salary = salary_elem.text.strip() if salary_elem else None
-                    
-                    job_text = f"{title} {company} {description}"
-                    relevance = self.calculate_relevance_score(job_text, keywords)
-                    
-                    if relevance < 15:
-                        continue
-                    
-                    job_posting = JobPosting(
-                        id=f"glassdoor_{hashlib.md5(job_url.encode()).hexdigest()[:8]}",
-                        title=title,
-                        company=company,
-                        location=job_location,
-                        description=self.clean_text(description),
-                        requirements=self.extract_technologies(job_text)[:5],
-                        technologies=self.extract_technologies(job_text),
-                        salary_range=salary or self.extract_salary_range(description),
-                        experience_level=self.detect_experience_level(title, description),
-                        remote_friendly=self.detect_remote_friendly(job_location, description),
-                        visa_sponsorship=self.detect_visa_sponsorship(description),
-                        posted_date=datetime.now().strftime('%Y-%m-%d'),
-                        source='Glassdoor',
-                        url=job_url,
-                        relevance_score=relevance,
-                        job_type=self.detect_job_type(description),
-                        benefits=[]
-                    )
-                    jobs.append(job_posting) if hasattr(title_elem, 'text') else title_elem.get('title', '')
-                    company = company_elem.text.strip() if company_elem else 'Company'
-                    job_location = location_elem.text.strip() if location_elem else location
-                    
-                    # Extract job URL
-                    link_elem = card.find('a', {'class': 'jcs-JobTitle'}) or \
-                               card.find('a', {'data-testid': 'job-title'}) or \
-                               card.find('a', href=True)
-                    
-                    if link_elem and link_elem.get('href'):
-                        job_url = f"https://www.indeed.com{link_elem['href']}" if link_elem['href'].startswith('/') else link_elem['href']
-                    else:
-                        job_url = url
-                    
-                    # Extract snippet/description
-                    snippet_elem = card.find('div', class_='job-snippet') or \
-                                  card.find('div', {'class': 'summary'}) or \
-                                  card.find('div', {'data-testid': 'job-snippet'})
-                    
-                    description = snippet_elem.text.strip() if snippet_elem else f"{title} at {company}"
-                    
-                    # Extract salary if available
-                    salary_elem = card.find('div', class_='salary-snippet') or \
-                                 card.find('span', class_='salary')
-                    salary = salary_elem.text.strip() if salary_elem else None
-                    
-                    # Extract posted date
-                    date_elem = card.find('span', class_='date') or \
-                               card.find('span', {'data-testid': 'job-posted-date'})
-                    posted_date = parse_date_flexible(date_elem.text.strip() if date_elem else '')
-                    
-                    job_text = f"{title} {company} {description}"
-                    relevance = self.calculate_relevance_score(job_text, keywords)
-                    
-                    if relevance < 15:
-                        continue
-                    
-                    job_posting = JobPosting(
-                        id=f"indeed_{hashlib.md5(job_url.encode()).hexdigest()[:8]}",
-                        title=title,
-                        company=company,
-                        location=job_location,
-                        description=self.clean_text(description),
-                        requirements=self.extract_technologies(job_text)[:5],
-                        technologies=self.extract_technologies(job_text),
-                        salary_range=salary or self.extract_salary_range(description),
-                        experience_level=self.detect_experience_level(title, description),
-                        remote_friendly=self.detect_remote_friendly(job_location, description),
-                        visa_sponsorship=self.detect_visa_sponsorship(description),
-                        posted_date=posted_date,
-                        source='Indeed',
-                        url=job_url,
-                        relevance_score=relevance,
-                        job_type=self.detect_job_type(description),
-                        benefits=self.extract_benefits(description)
-                    )
-                    jobs.append(job_posting)
-                    
-                except Exception as e:
-                    logger.debug(f"Error parsing Indeed job card: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error scraping Indeed: {e}")
-        
-        return jobs
-
-    def scrape_all_sources(self, keywords: str, location: str = "", max_total: int = 25) -> List[JobPosting]:
-        """Scrape from specified real sources only."""
-        all_jobs = []
-        
-        try:
-            logger.info(f"Starting REAL job search for: {keywords}, Location: {location if location else 'Any'}")
-            
-            # LinkedIn (target: ~10 jobs)
-            linkedin_jobs = self.scrape_linkedin(keywords, location, max_jobs=10)
-            all_jobs.extend(linkedin_jobs)
-            logger.info(f"Scraped {len(linkedin_jobs)} jobs from LinkedIn.")
-            time.sleep(random.uniform(1.0, 2.5)) # Be respectful
-            
-            # Indeed (target: ~10 jobs)
-            indeed_jobs = self.scrape_indeed(keywords, location, max_jobs=10)
-            all_jobs.extend(indeed_jobs)
-            logger.info(f"Scraped {len(indeed_jobs)} jobs from Indeed.")
-            time.sleep(random.uniform(1.0, 2.5))
-            
-            # RemoteOK (API - target: ~5 jobs)
-            remoteok_jobs = self.scrape_remoteok(keywords, max_jobs=5)
-            all_jobs.extend(remoteok_jobs)
-            logger.info(f"Scraped {len(remoteok_jobs)} jobs from RemoteOK.")
-            
-            logger.info(f"Scraped a total of {len(all_jobs)} potential jobs from all real sources.")
-            
-        except Exception as e:
-            logger.error(f"Error in main scraping loop: {e}")
-        
-        # Deduplicate jobs
-        unique_jobs_dict = {}
-        for job in all_jobs:
-            # Use a tuple of critical fields for deduplication key
-            key = (job.title.lower().strip(), 
-                   job.company.lower().strip(), 
-                   job.location.lower().strip(), 
-                   job.source.lower().strip() # Add source to key for more precise deduplication
-                  )
-            
-            # Prioritize jobs with higher relevance or more complete URLs if duplicate
-            if key not in unique_jobs_dict or \
-               job.relevance_score > unique_jobs_dict[key].relevance_score or \
-               (job.relevance_score == unique_jobs_dict[key].relevance_score and len(job.url) > len(unique_jobs_dict[key].url) and job.url != unique_jobs_dict[key].url) or \
-               (job.relevance_score == unique_jobs_dict[key].relevance_score and not unique_jobs_dict[key].url and job.url): # Prefer job with URL if other has none
-                unique_jobs_dict[key] = job
-        
-        unique_jobs = list(unique_jobs_dict.values())
-        
-        # Filter out jobs with zero relevance (indicates conflicting terms)
-        unique_jobs = [job for job in unique_jobs if job.relevance_score > 0]
-        
-        # Sort by relevance score (highest first)
-        unique_jobs.sort(key=lambda x: x.relevance_score, reverse=True)
-        
-        # Return top jobs, up to max_total
-        final_jobs = unique_jobs[:max_total]
-        logger.info(f"Returning {len(final_jobs)} real jobs after deduplication and sorting.")
-        
-        return final_jobs
-
-    def search_jobs(self, keywords: str, location: str = "", max_results: int = 25) -> List[Dict]:
-        """
-        Main method to search for jobs across all sources.
-        """
-        try:
-            # Get jobs from all sources
-            jobs = self.scrape_all_sources(
-                keywords=keywords,
-                location=location,
-                max_total=max_results
-            )
-            
-            # Convert to dictionaries for JSON response
-            return [job.to_dict() for job in jobs]
-            
-        except Exception as e:
-            logger.error(f"Error in search_jobs: {str(e)}")
-            return []
-
-    def save_jobs_to_file(self, jobs: List[Dict], filename: str = "jobs.json"):
-        """Save jobs to JSON file with proper formatting."""
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(jobs, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved {len(jobs)} jobs to {filename}")
-        except Exception as e:
-            logger.error(f"Error saving jobs to file: {e}")
-
-    def format_jobs_for_display(self, jobs: List[Dict]) -> str:
-        """Format jobs for console display."""
-        output = []
-        output.append(f"\n{'='*80}")
-        output.append(f"Found {len(jobs)} jobs")
-        output.append(f"{'='*80}\n")
-        
-        for i, job in enumerate(jobs, 1):
-            output.append(f"{i}. {job['title']} at {job['company']}")
-            output.append(f"   Location: {job['location']}")
-            output.append(f"   Experience: {job['experience_level']}")
-            if job.get('salary_range'):
-                output.append(f"   Salary: {job['salary_range']}")
-            output.append(f"   Source: {job['source']}")
-            output.append(f"   Relevance: {job['relevance_score']}%")
-            if job.get('technologies'):
-                output.append(f"   Technologies: {', '.join(job['technologies'][:5])}")
-            output.append(f"   URL: {job['url']}")
-            output.append("")
-        
-        return "\n".join(output)
-
-
-# Example usage
-if __name__ == "__main__":
-    # Initialize the scraper
-    scraper = JobScraper()
-    
-    # Example searches
-    print("Starting job search examples...\n")
-    
-    # Search 1: Python developer jobs
-    print("Searching for Python Developer jobs...")
-    python_jobs = scraper.search_jobs("python developer", "Remote", max_results=15)
-    print(scraper.format_jobs_for_display(python_jobs[:5]))
-    scraper.save_jobs_to_file(python_jobs, "python_jobs.json")
-    
-    print("\n" + "="*80 + "\n")
-    
-    # Search 2: Data scientist jobs
-    print("Searching for Data Scientist jobs...")
-    data_jobs = scraper.search_jobs("data scientist", "San Francisco", max_results=10)
-    print(scraper.format_jobs_for_display(data_jobs[:3]))
-    scraper.save_jobs_to_file(data_jobs, "data_scientist_jobs.json")
-    
-    print("\n" + "="*80 + "\n")
-    
-    # Search 3: React developer jobs
-    print("Searching for React Developer jobs...")
-    react_jobs = scraper.search_jobs("react developer", "", max_results=10)
-    print(scraper.format_jobs_for_display(react_jobs[:3]))
-    scraper.save_jobs_to_file(react_jobs, "react_jobs.json")
-    
+import asyncio
+import aiohttp
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html as lxml_html
+from typing import List, Dict, Optional, AsyncIterator, Tuple
+import re
+from datetime import datetime, timedelta
+from urllib.parse import quote_plus, urlparse, urlencode
+from dataclasses import dataclass, field
+import random
+import logging
+import html
+from email.utils import parsedate_to_datetime
+import hashlib
+from functools import lru_cache, partial
+import heapq
+import ahocorasick
+import orjson
+from cachetools import TTLCache
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Patterns used on every scraped job, compiled once at import
+_RE_RELATIVE_DATE = re.compile(r'(\d+)\s*(day|week|month)s?\s*ago')
+_RELATIVE_DATE_DAYS = {'day': 1, 'week': 7, 'month': 30}
+# Last-resort date formats, tried in order (add as needed)
+_MANUAL_DATE_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%b %d, %Y', # Jan 01, 2023
+    '%d %b %Y',   # 01 Jan 2023
+    '%m/%d/%Y',   # 01/01/2023
+    '%B %d, %Y', # January 01, 2023
+    '%d/%m/%Y',   # 01/01/2023 (European format)
+)
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_SPECIAL_CHARS = re.compile(r'[^\w\s\-\.,!?()]+')
+_RE_KEYWORD_SPLIT = re.compile(r'[,\s]+')
+# All salary formats in one alternation so the text is scanned once
+_RE_SALARY = re.compile('|'.join((
+    r'\$[\d,]+k?\s*-\s*\$[\d,]+k?',  # $100,000 - $150,000 / $100k - $150k
+    r'[\d,]+\s*-\s*[\d,]+\s*(?:USD|EUR|GBP)',  # 100,000 - 150,000 USD
+    r'€[\d,]+\s*-\s*€[\d,]+',  # €100,000 - €150,000
+    r'£[\d,]+\s*-\s*£[\d,]+',  # £100,000 - £150,000
+)), re.IGNORECASE)
+
+# Every Indeed card layout we know of; keep in sync with the selectors in _parse_indeed
+_INDEED_CARD_CLASSES = frozenset(('job_seen_beacon', 'jobsearch-SerpJobCard', 'slider_container'))
+# While parsing, the strainer sees the raw class attribute, so split it: cards usually carry several classes
+_INDEED_CARD_STRAINER = SoupStrainer('div', class_=lambda c: bool(c) and not _INDEED_CARD_CLASSES.isdisjoint(c.split()))
+
+class _CardIndex:
+    """
+    A job card's tags grouped by name in one walk, so a card's dozen or so find() lookups
+    each check a few same-named tags instead of walking the whole card again.
+    """
+    def __init__(self, card):
+        self._by_name = {}
+        for tag in card.find_all(True):
+            self._by_name.setdefault(tag.name, []).append(tag)
+
+    def find(self, name: str, attrs: Optional[Dict] = None, **kwargs):
+        """First tag in document order like card.find(name, attrs, **kwargs), for exact or True attribute values."""
+        conditions = dict(attrs or {}, **kwargs)
+        if 'class_' in conditions:
+            conditions['class'] = conditions.pop('class_')
+        for tag in self._by_name.get(name, ()):
+            if all(_attr_matches(tag, attr, expected) for attr, expected in conditions.items()):
+                return tag
+        return None
+
+def _attr_matches(tag, attr: str, expected) -> bool:
+    value = tag.get(attr)
+    if expected is True:
+        return value is not None
+    if isinstance(value, list):
+        # Multi-valued (class): any single value or the whole string, as bs4 matches
+        return expected in value or ' '.join(value) == expected
+    return value == expected
+
+def _class_xpath(path: str, tag: str, css_class: str) -> etree.XPath:
+    """Compiled XPath for `tag` elements under `path` having css_class among their classes, like bs4's class_=."""
+    return etree.XPath(f"{path}{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]")
+
+def _first(xpath: etree.XPath, element) -> Optional[etree._Element]:
+    matches = xpath(element)
+    return matches[0] if matches else None
+
+# LinkedIn card selectors, compiled once
+_LINKEDIN_CARDS = _class_xpath('//', 'div', 'base-card')
+_LINKEDIN_TITLE = _class_xpath('.//', 'h3', 'base-search-card__title')
+_LINKEDIN_COMPANY = _class_xpath('.//', 'h4', 'base-search-card__subtitle')
+_LINKEDIN_LOCATION = _class_xpath('.//', 'span', 'job-search-card__location')
+_LINKEDIN_LINK = _class_xpath('.//', 'a', 'base-card__full-link')
+_LINKEDIN_METADATA = _class_xpath('.//', 'div', 'base-search-card__metadata')
+
+def _url_id(url: str) -> str:
+    """Short, stable id for a job URL, used to tell postings apart."""
+    return hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+
+# Helper function for flexible date parsing
+def parse_date_flexible(date_str: Optional[str], now: Optional[datetime] = None) -> str:
+    """
+    Tries to parse a date string from common formats.
+    Pass `now` to resolve relative dates against one timestamp for a whole batch of jobs.
+    """
+    if now is None:
+        now = datetime.now()
+    if not date_str:
+        return now.strftime('%Y-%m-%d')
+    
+    # Handle relative dates
+    date_str_lower = date_str.lower()
+    if 'today' in date_str_lower or 'just now' in date_str_lower:
+        return now.strftime('%Y-%m-%d')
+    elif 'yesterday' in date_str_lower:
+        return (now - timedelta(days=1)).strftime('%Y-%m-%d')
+    elif 'ago' in date_str_lower:
+        match = _RE_RELATIVE_DATE.search(date_str_lower)
+        if match:
+            days = int(match.group(1)) * _RELATIVE_DATE_DAYS[match.group(2)]
+            return (now - timedelta(days=days)).strftime('%Y-%m-%d')
+    
+    # Attempt 1: ISO 8601 (e.g., "2023-10-26T15:00:00Z" or "2023-10-26 15:00:00")
+    try:
+        temp_date_str = date_str
+        if temp_date_str.endswith('Z'):
+            temp_date_str = temp_date_str[:-1] + '+00:00'
+        # Replace space with T if it's likely ISO format without T
+        if ' ' in temp_date_str and 'T' not in temp_date_str and temp_date_str.count(':') >= 2:
+             parts = temp_date_str.split(' ')
+             if len(parts) == 2 and '-' in parts[0] and ':' in parts[1]:
+                temp_date_str = 'T'.join(parts)
+        
+        dt_obj = datetime.fromisoformat(temp_date_str)
+        return dt_obj.strftime('%Y-%m-%d')
+    except ValueError:
+        pass
+
+    # Attempt 2: RFC 822 (common in RSS, e.g., "Wed, 02 Oct 2002 08:00:00 EST")
+    try:
+        dt_obj = parsedate_to_datetime(date_str)
+        return dt_obj.strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        pass
+        
+    # Attempt 3: Other common formats (add as needed)
+    for fmt in _MANUAL_DATE_FORMATS:
+        try:
+            dt_obj = datetime.strptime(date_str, fmt)
+            return dt_obj.strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+            
+    logger.warning(f"Could not parse date: '{date_str}'. Using current date.")
+    return now.strftime('%Y-%m-%d')
+
+@dataclass(frozen=True, slots=True)
+class JobPosting:
+    """Enhanced job posting data structure."""
+    id: str
+    title: str
+    company: str
+    location: str
+    description: str
+    requirements: List[str]
+    technologies: List[str]
+    salary_range: Optional[str]
+    experience_level: str  # junior, mid, senior
+    remote_friendly: bool
+    visa_sponsorship: bool
+    posted_date: str
+    source: str
+    url: str
+    relevance_score: float  # 0-100 match to search
+    job_type: Optional[str] = None  # full-time, part-time, contract, etc.
+    benefits: Optional[List[str]] = None
+    # Normalized (title, company, location, source) used to spot duplicates, built once per posting
+    dedup_key: Tuple[str, str, str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'dedup_key', (
+            self.title.lower().strip(),
+            self.company.lower().strip(),
+            self.location.lower().strip(),
+            self.source.lower().strip(),
+        ))
+
+    def to_dict(self) -> Dict:
+        # Built by hand: asdict() deep-copies every field through a recursive Python walk.
+        # The lists are still copied, so callers can't mutate cached postings.
+        return {
+            'id': self.id,
+            'title': self.title,
+            'company': self.company,
+            'location': self.location,
+            'description': self.description,
+            'requirements': list(self.requirements),
+            'technologies': list(self.technologies),
+            'salary_range': self.salary_range,
+            'experience_level': self.experience_level,
+            'remote_friendly': self.remote_friendly,
+            'visa_sponsorship': self.visa_sponsorship,
+            'posted_date': self.posted_date,
+            'source': self.source,
+            'url': self.url,
+            'relevance_score': self.relevance_score,
+            'job_type': self.job_type,
+            'benefits': list(self.benefits) if self.benefits is not None else None
+        }
+
+@dataclass(slots=True)
+class _JobAnalysis:
+    """One job card's text, lowercased once and shared by every detector."""
+    title: str
+    company: str
+    description: str
+    location: str = ""
+    # Derived in __post_init__; declared so they get slots too (built for every card, rejected ones included)
+    title_lower: str = field(init=False, repr=False)
+    description_lower: str = field(init=False, repr=False)
+    location_lower: str = field(init=False, repr=False)
+    job_text_lower: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.title_lower = self.title.lower()
+        self.description_lower = self.description.lower()
+        self.location_lower = self.location.lower()
+        self.job_text_lower = f"{self.title_lower} {self.company.lower()} {self.description_lower}"
+
+# Keyword tables for the per-job detectors. Each is compiled into an Aho-Corasick
+# automaton so a job's text is scanned once per table instead of once per keyword.
+TECHNOLOGIES = [
+    'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node.js', 'nodejs',
+    'django', 'flask', 'fastapi', 'spring', 'typescript', 'php', 'ruby', 'rails',
+    'go', 'golang', 'rust', 'c++', 'c#', '.net', 'sql', 'postgresql', 'mysql',
+    'mongodb', 'redis', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform',
+    'git', 'linux', 'html', 'css', 'sass', 'webpack', 'jenkins', 'graphql',
+    'elasticsearch', 'kafka', 'rabbitmq', 'nginx', 'apache', 'pandas', 'numpy',
+    'tensorflow', 'pytorch', 'scikit-learn', 'spark', 'hadoop', 'scala', 'kotlin',
+    'swift', 'objective-c', 'flutter', 'xamarin', 'unity', 'unreal', 'matlab',
+    'r', 'sas', 'tableau', 'power bi', 'excel', 'jira', 'confluence', 'slack'
+]
+
+BENEFIT_KEYWORDS = {
+    'health insurance': ['health insurance', 'medical insurance', 'healthcare', 'medical coverage'],
+    'dental insurance': ['dental insurance', 'dental coverage', 'dental plan'],
+    'vision insurance': ['vision insurance', 'vision coverage', 'vision plan'],
+    '401k': ['401k', '401(k)', 'retirement plan', 'pension'],
+    'paid time off': ['pto', 'paid time off', 'vacation days', 'holiday pay'],
+    'remote work': ['remote work', 'work from home', 'wfh', 'telecommute'],
+    'flexible hours': ['flexible hours', 'flex time', 'flexible schedule'],
+    'stock options': ['stock options', 'equity', 'espp', 'rsu'],
+    'bonus': ['bonus', 'performance bonus', 'annual bonus'],
+    'parental leave': ['parental leave', 'maternity leave', 'paternity leave'],
+    'professional development': ['professional development', 'training budget', 'conference budget'],
+    'gym membership': ['gym membership', 'fitness benefit', 'wellness program']
+}
+
+# Frontend options for reference: const experienceLevels = ["Entry-level", "Junior", "Mid-level", "Senior", "Lead", "Principal"];
+EXPERIENCE_LEVEL_KEYWORDS = {
+    'Principal': ['principal engineer', 'principal software engineer', 'principal architect', 'principal consultant'],
+    'Lead': ['lead engineer', 'tech lead', 'team lead', 'lead developer', 'development lead', 'engineering lead'],
+    'Senior': ['senior', 'sr.', 'sr ', 'staff engineer', 'architect', # Architect often implies senior
+               'manager', 'director', 'expert', 'head of', 
+               '7+ years', '8+ years', '9+ years', '10+ years', '10+ yrs', '7+ yrs', 'seven years', 'eight years', 'ten years'],
+    # Note: 'software engineer' without other qualifiers often implies mid-level. This is hard with keywords alone.
+    'Mid-level': ['mid-level', 'mid level', 'intermediate', 'mid-senior', 
+                  '3-5 years', '4-6 years', '5-7 years', '3+ years', '3+ yrs', 'three years', 'four years', 'five years',
+                  'engineer ii', 'developer ii'],
+    # Entry-level has more specific terms like intern, graduate
+    'Entry-level': ['entry-level', 'entry level', 'graduate', 'new grad', 'graduating',
+                    'intern', 'internship', 'trainee', 
+                    '0-1 year', '0-2 years', '<1 year', '<2 years', 'no experience required', 'recent graduate'],
+    'Junior': ['junior', 'jr.', 'jr ', 'associate software engineer', 'associate developer', 
+               '1-3 years', '1-2 yrs', '2-3 years', 'one year', 'two years', 'three years experience', # "three years" could be mid, context matters
+               'engineer i', 'developer i'],
+}
+
+# Most senior/specific first; "Entry-level" is prioritized over "Junior" when both match
+EXPERIENCE_LEVEL_PRECEDENCE = ('Principal', 'Lead', 'Senior', 'Mid-level', 'Entry-level', 'Junior')
+
+# These short lists stay plain substring scans that stop at the first hit (not automata).
+# Job types are checked in order and the first one with a hit wins.
+JOB_TYPE_KEYWORDS = {
+    'Full-time': ('full-time', 'full time', 'ft'),
+    'Part-time': ('part-time', 'part time', 'pt'),
+    'Contract': ('contract', 'contractor', 'freelance'),
+    'Internship': ('internship', 'intern'),
+    'Temporary': ('temporary', 'temp'),
+}
+REMOTE_INDICATORS = (
+    'remote', 'work from home', 'distributed', 'anywhere',
+    'telecommute', 'wfh', 'virtual', 'home office', 'remote-first'
+)
+VISA_INDICATORS = (
+    'visa sponsorship', 'h1b', 'h-1b', 'work permit', 'immigration support',
+    'international candidates', 'work authorization', 'sponsor visa',
+    'visa assistance', 'green card', 'employment authorization'
+)
+NO_VISA_INDICATORS = (
+    'no visa sponsorship', 'cannot sponsor', 'unable to sponsor',
+    'must be authorized', 'must have work authorization',
+    'citizen or permanent resident'
+)
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def _build_automaton(term_labels: Dict[str, List[str]], whole_words: bool = False) -> ahocorasick.Automaton:
+    """
+    Compile {label: [lowercase terms]} into an automaton mapping each term to its labels.
+    With whole_words, a term only matches where it starts and ends on a word boundary (like regex \\b).
+    """
+    labels_by_term = {}
+    for label, terms in term_labels.items():
+        for term in terms:
+            labels_by_term.setdefault(term, []).append(label)
+    automaton = ahocorasick.Automaton()
+    for term, labels in labels_by_term.items():
+        # Boundaries only apply at word-character edges, so 'sr.' or '<1 year' still match as written
+        check_start = whole_words and _is_word_char(term[0])
+        check_end = whole_words and _is_word_char(term[-1])
+        automaton.add_word(term, (tuple(labels), len(term) - 1, check_start, check_end))
+    automaton.make_automaton()
+    return automaton
+
+def _match_labels(automaton: ahocorasick.Automaton, text_lower: str) -> set:
+    """Labels of every term found in text_lower, including overlapping matches."""
+    found = set()
+    last = len(text_lower) - 1
+    for end, (labels, span, check_start, check_end) in automaton.iter(text_lower):
+        if check_start and end > span and _is_word_char(text_lower[end - span - 1]):
+            continue
+        if check_end and end < last and _is_word_char(text_lower[end + 1]):
+            continue
+        found.update(labels)
+    return found
+
+# Whole words only, so "javascript" isn't "java", "good" isn't "go", "equity" needs more than "inequity",
+# "architecture" isn't "architect" and "internal" isn't "intern"
+_TECH_AUTOMATON = _build_automaton({tech.title(): [tech] for tech in TECHNOLOGIES}, whole_words=True)
+_TECH_ORDER = {tech.title(): i for i, tech in enumerate(TECHNOLOGIES)}
+_BENEFIT_AUTOMATON = _build_automaton(BENEFIT_KEYWORDS, whole_words=True)
+_EXPERIENCE_LEVEL_AUTOMATON = _build_automaton(EXPERIENCE_LEVEL_KEYWORDS, whole_words=True)
+
+# Per-text extraction, memoized on the text itself. RemoteOK serves the same listing to every search,
+# so searches within a few minutes of each other see the same descriptions again.
+EXTRACTION_CACHE_SIZE = 256
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def _technologies_in(text_lower: str) -> Tuple[str, ...]:
+    found_techs = _match_labels(_TECH_AUTOMATON, text_lower)
+    # Keep table order so the 15-item cut is stable between runs
+    return tuple(sorted(found_techs, key=_TECH_ORDER.get)[:15])  # Limit to 15 technologies
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def _salary_range_in(text: str) -> Optional[str]:
+    match = _RE_SALARY.search(text)
+    return match.group(0) if match else None
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def _job_type_of(text_lower: str) -> str:
+    for job_type, terms in JOB_TYPE_KEYWORDS.items():
+        if any(term in text_lower for term in terms):
+            return job_type
+    return 'Full-time'  # Default
+
+# Search term -> job text terms that make a job irrelevant to it
+EXPERIENCE_CONFLICTS = {
+    'junior': ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of'],
+    'entry': ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of', 'mid-level', 'experienced'],
+    'entry-level': ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of', 'mid-level', 'experienced'],
+    'intern': ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of', 'mid-level', 'experienced'],
+    'senior': ['junior', 'entry', 'entry-level', 'intern', 'trainee', 'graduate'],
+    'lead': ['junior', 'entry', 'entry-level', 'intern', 'trainee', 'graduate'],
+    'principal': ['junior', 'entry', 'entry-level', 'intern', 'trainee', 'graduate', 'mid-level'],
+}
+
+JOB_TYPE_CONFLICTS = {
+    'full-time': ['part-time', 'contract', 'freelance', 'temporary', 'intern'],
+    'part-time': ['full-time'],
+    'contract': ['full-time', 'permanent'],
+    'freelance': ['full-time', 'permanent'],
+    'permanent': ['contract', 'freelance', 'temporary'],
+    'remote': ['on-site only', 'in-office only'],
+}
+
+def _drop_redundant_terms(terms: List[str]) -> Tuple[str, ...]:
+    """
+    Keep only terms that don't contain another of the terms: any text containing a dropped
+    term ('entry-level') also contains the term inside it ('entry'), so any(...) is unchanged.
+    """
+    return tuple(term for term in terms if not any(other != term and other in term for other in terms))
+
+@dataclass(frozen=True)
+class _Query:
+    """Search keywords prepared once per search and reused to score every job."""
+    keywords: Tuple[str, ...]
+    synonyms: Tuple[Tuple[str, ...], ...]  # Synonyms for each keyword, in the same order
+    conflicts: Tuple[str, ...]
+    weights: Tuple[float, ...]  # Points for a direct match on each keyword
+    max_score: float  # Raw score that normalizes to 100
+
+class JobScraper:
+    """Improved job scraper with multiple sources and fallbacks."""
+    
+    # Maximum number of in-flight HTTP requests across all sources
+    MAX_CONCURRENT_REQUESTS = 8
+    # Politeness: at most this many open connections to any one site, across all searches
+    MAX_REQUESTS_PER_HOST = 2
+    # Seconds a source's results are reused for the same search
+    SCRAPE_CACHE_TTL = 300
+    # Extra attempts for a request that fails to connect or times out, with exponential backoff (seconds)
+    FETCH_RETRIES = 2
+    FETCH_RETRY_BACKOFF = 0.3
+    # Rate-limit responses that are retried too, waiting out Retry-After up to MAX_RETRY_AFTER seconds
+    RETRY_STATUSES = (429, 503)
+    MAX_RETRY_AFTER = 5
+    
+    def __init__(self):
+        # Shared aiohttp session, created lazily inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        # Recent results per (source, search); tuples of frozen postings, so sharing them is safe
+        self._scrape_cache = TTLCache(maxsize=256, ttl=self.SCRAPE_CACHE_TTL)
+        # Worker threads for page parsing; SCRAPER_PARALLEL<=1 scrapes sources one after another
+        self.parallelism = int(os.environ.get("SCRAPER_PARALLEL", "8"))
+        # SCRAPER_PARSE_PROCESSES>0 parses in that many worker processes instead, so BeautifulSoup's
+        # pure-Python tree building doesn't hold this process's GIL; worth it for large pages under load
+        parse_processes = int(os.environ.get("SCRAPER_PARSE_PROCESSES", "0"))
+        if self.parallelism <= 1:
+            self._parse_executor = None
+        elif parse_processes > 0:
+            self._parse_executor = ProcessPoolExecutor(max_workers=parse_processes, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            self._parse_executor = ThreadPoolExecutor(max_workers=self.parallelism, thread_name_prefix="scraper")
+        self.user_agents = [
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/120.0',
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15'
+        ]
+        
+        # Technology synonyms for better matching
+        self.tech_synonyms = {
+            'javascript': ['js', 'javascript', 'node', 'nodejs', 'ecmascript'],
+            'python': ['python', 'py', 'django', 'flask', 'fastapi', 'pandas', 'numpy'],
+            'react': ['react', 'reactjs', 'react.js', 'redux'],
+            'angular': ['angular', 'angularjs', 'angular.js'],
+            'vue': ['vue', 'vuejs', 'vue.js', 'nuxt'],
+            'java': ['java', 'spring', 'springboot', 'hibernate', 'jvm'],
+            'golang': ['go', 'golang'],
+            'csharp': ['c#', 'csharp', '.net', 'dotnet', 'asp.net'],
+            'php': ['php', 'laravel', 'symfony', 'wordpress'],
+            'ruby': ['ruby', 'rails', 'rubyonrails', 'ror'],
+            'swift': ['swift', 'ios', 'swiftui'],
+            'kotlin': ['kotlin', 'android'],
+            'typescript': ['typescript', 'ts'],
+            'rust': ['rust', 'rustlang'],
+            'database': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch'],
+            'cloud': ['aws', 'azure', 'gcp', 'cloud', 'devops'],
+            'container': ['docker', 'kubernetes', 'k8s', 'containerization']
+        }
+        # Inverted index: term -> every synonym from any group containing it, minus redundant ones
+        grouped_synonyms = {}
+        for group in self.tech_synonyms.values():
+            for term in group:
+                synonyms = grouped_synonyms.setdefault(term, [])
+                synonyms.extend(syn for syn in group if syn not in synonyms)
+        self._synonyms_by_term = {term: _drop_redundant_terms(synonyms) for term, synonyms in grouped_synonyms.items()}
+
+    def __getstate__(self):
+        # A parse process only needs the parsers' tables; connections, pools and cached results stay here
+        state = self.__dict__.copy()
+        for name in ('_session', '_session_loop', '_request_semaphore', '_parse_executor', '_scrape_cache'):
+            state[name] = None
+        return state
+
+    def _detached(self) -> 'JobScraper':
+        """A copy for another event loop: shares the parse pool and tables, but not the session or result cache."""
+        scraper = object.__new__(JobScraper)
+        scraper.__dict__.update(self.__dict__)
+        scraper._session = None
+        scraper._session_loop = None
+        scraper._request_semaphore = None
+        scraper._scrape_cache = TTLCache(maxsize=256, ttl=self.SCRAPE_CACHE_TTL)
+        return scraper
+
+    def get_random_user_agent(self) -> str:
+        """Get a random user agent to avoid blocking."""
+        return random.choice(self.user_agents)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, reusing pooled connections and cached DNS across searches."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # aiohttp negotiates gzip/deflate itself, and br too when Brotli is installed (aiohttp[speedups])
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=self.MAX_REQUESTS_PER_HOST, ttl_dns_cache=300),
+                headers={'User-Agent': self.get_random_user_agent()}
+            )
+            self._session_loop = loop
+            self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def shutdown_parse_pool(self):
+        """Stop the parse workers; separate from close(), which also runs after every sync search."""
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(cancel_futures=True)
+            self._parse_executor = None
+
+    async def _fetch(self, url: str, headers: Dict, read):
+        """GET url and return await read(response), retrying dropped connections, timeouts and rate limiting."""
+        session = await self._get_session()
+        for attempt in range(self.FETCH_RETRIES + 1):
+            delay = self.FETCH_RETRY_BACKOFF * 2 ** attempt
+            try:
+                async with self._request_semaphore:
+                    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                        if response.status in self.RETRY_STATUSES and attempt < self.FETCH_RETRIES:
+                            delay = max(delay, self._retry_after(response.headers.get('Retry-After')))
+                            logger.debug(f"Retrying {url} in {delay:.1f}s after HTTP {response.status}")
+                        else:
+                            response.raise_for_status()
+                            return await read(response)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == self.FETCH_RETRIES:
+                    raise
+                logger.debug(f"Retrying {url} after {e!r}")
+            # Back off outside the semaphore so the slot goes to other requests meanwhile
+            await asyncio.sleep(delay)
+
+    def _retry_after(self, value: Optional[str]) -> float:
+        """Seconds a Retry-After header asks for, capped at MAX_RETRY_AFTER; 0 if absent or an HTTP date."""
+        try:
+            return min(max(float(value), 0.0), self.MAX_RETRY_AFTER)
+        except (TypeError, ValueError):
+            return 0.0
+
+    async def _fetch_text(self, url: str, headers: Dict) -> str:
+        """GET a page and return its decoded body."""
+        return await self._fetch(url, headers, lambda response: response.text())
+
+    async def _fetch_page(self, url: str, headers: Dict) -> Tuple[bytes, str]:
+        """GET a page and return its undecoded body with its encoding (as declared, else detected)."""
+        async def read(response):
+            return await response.read(), response.get_encoding()
+        return await self._fetch(url, headers, read)
+
+    async def _fetch_json(self, url: str, headers: Dict):
+        """GET an API endpoint and return its decoded JSON body."""
+        # orjson parses the raw bytes, skipping the str decode and stdlib parser that response.json() uses
+        body = await self._fetch(url, headers, lambda response: response.read())
+        return orjson.loads(body)
+
+    async def _parse_off_loop(self, parser, *args) -> List[JobPosting]:
+        """Run a CPU-bound page parser on the worker pool (threads or processes) so other sources keep downloading."""
+        if self._parse_executor is None:
+            return parser(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_executor, parser, *args)
+
+    def clean_text(self, text: str) -> str:
+        """Clean and normalize text."""
+        if not text:
+            return ""
+        
+        # Unescape HTML entities first
+        text = html.unescape(text)
+        # Remove HTML tags
+        text = _RE_HTML_TAG.sub(' ', text)
+        # Remove multiple spaces
+        text = _RE_WHITESPACE.sub(' ', text)
+        # Remove special characters but keep basic punctuation
+        text = _RE_SPECIAL_CHARS.sub('', text)
+        # Trim and limit length
+        text = text.strip()
+        if len(text) > 1000:
+            text = text[:997] + '...'
+        return text
+
+    def extract_salary_range(self, text: str) -> Optional[str]:
+        """Extract salary range from job text."""
+        return _salary_range_in(text)
+
+    def extract_technologies(self, text_lower: str) -> List[str]:
+        """Extract technologies from lowercased job text."""
+        return list(_technologies_in(text_lower))
+
+    def extract_benefits(self, text_lower: str) -> List[str]:
+        """Extract benefits from a lowercased job description."""
+        found_benefits = _match_labels(_BENEFIT_AUTOMATON, text_lower)
+        benefits = [benefit for benefit in BENEFIT_KEYWORDS if benefit in found_benefits]
+        return benefits[:8]  # Limit to 8 benefits
+
+    def detect_job_type(self, text_lower: str) -> str:
+        """Detect job type from lowercased text."""
+        return _job_type_of(text_lower)
+
+    def detect_experience_level(self, title_lower: str, description_lower: str) -> str:
+        text = f"{title_lower} {description_lower}"
+        # One pass over the text collects every level with a keyword hit;
+        # the most senior (or most specific) one wins
+        found_levels = _match_labels(_EXPERIENCE_LEVEL_AUTOMATON, text)
+        for level in EXPERIENCE_LEVEL_PRECEDENCE:
+            if level in found_levels:
+                return level
+        
+        # Fallback title checks (less reliable than full text but good for some cases)
+        # These are checked if the above keyword checks on full text didn't return.
+        if 'principal' in title_lower: return "Principal"
+        if 'lead' in title_lower: return "Lead"
+        if 'senior' in title_lower or 'sr ' in title_lower: return "Senior"
+        # Check for mid-level in title if possible, though less common as explicit term
+        if 'mid-level' in title_lower or 'mid level' in title_lower: return "Mid-level"
+        if 'junior' in title_lower or 'jr ' in title_lower: return "Junior"
+        if 'entry' in title_lower or 'intern' in title_lower or 'graduate' in title_lower : return "Entry-level"
+        
+        # Default if nothing clearly matches after all checks
+        return "Mid-level"
+
+    def detect_remote_friendly(self, location_lower: str, description_lower: str) -> bool:
+        """Detect if job is remote-friendly."""
+        text = f"{location_lower} {description_lower}"
+        return any(indicator in text for indicator in REMOTE_INDICATORS)
+
+    def detect_visa_sponsorship(self, text: str) -> bool:
+        """Detect if job offers visa sponsorship, given the lowercased description."""
+        # Negative indicators win over positive ones
+        if any(indicator in text for indicator in NO_VISA_INDICATORS):
+            return False
+        
+        return any(indicator in text for indicator in VISA_INDICATORS)
+
+    def _prepare_query(self, keywords: str) -> _Query:
+        """Split search keywords and resolve their synonyms and conflicts once per search."""
+        keywords_lower = keywords.lower()
+        
+        # If the user searches for one of these terms, jobs mentioning a conflicting term are excluded
+        conflicts = []
+        for conflict_table in (EXPERIENCE_CONFLICTS, JOB_TYPE_CONFLICTS):
+            for search_term, terms in conflict_table.items():
+                if search_term in keywords_lower:
+                    conflicts.extend(term for term in terms if term not in conflicts)
+        
+        # Split keywords by common delimiters
+        keyword_list = _RE_KEYWORD_SPLIT.split(keywords_lower)
+        keyword_list = tuple(k.strip() for k in keyword_list if k.strip())
+        
+        # Every synonym from any group the keyword belongs to counts as a synonym match
+        synonym_lists = [self._synonyms_by_term.get(keyword, ()) for keyword in keyword_list]
+        
+        # Direct match, plus a partial-match bonus for longer keywords
+        weights = tuple(25.0 if len(keyword) > 3 else 20.0 for keyword in keyword_list)
+        
+        return _Query(
+            keywords=keyword_list,
+            synonyms=tuple(synonym_lists),
+            conflicts=_drop_redundant_terms(conflicts),
+            weights=weights,
+            max_score=len(keyword_list) * 20.0
+        )
+
+    def calculate_relevance_score(self, job_text_lower: str, query: _Query) -> float:
+        """Calculate relevance score between lowercased job text and prepared search keywords."""
+        # Check for conflicting terms
+        if any(conflict in job_text_lower for conflict in query.conflicts):
+            return 0.0
+        
+        score = 0.0
+        for keyword, weight, synonyms in zip(query.keywords, query.weights, query.synonyms):
+            if keyword in job_text_lower:
+                score += weight
+            
+            # Check synonyms
+            if synonyms and any(syn in job_text_lower for syn in synonyms):
+                score += 15.0
+        
+        # Normalize score
+        if query.max_score > 0:
+            score = min(100.0, (score / query.max_score) * 100)
+        
+        return round(score, 1)
+
+    async def _cached_scrape(self, key: tuple, scrape, *args) -> List[JobPosting]:
+        """Return a source's recent results for the same search, scraping on a miss."""
+        jobs = self._scrape_cache.get(key)
+        if jobs is None:
+            jobs = tuple(await scrape(*args))
+            # Empty results are usually a blocked or failed request, so retry those next time
+            if jobs:
+                self._scrape_cache[key] = jobs
+        return list(jobs)
+
+    async def scrape_remoteok(self, keywords: str, max_jobs: int = 10) -> List[JobPosting]:
+        """Scrape RemoteOK API - most reliable source."""
+        return await self._cached_scrape(('RemoteOK', keywords, max_jobs), self._scrape_remoteok, keywords, max_jobs)
+
+    async def _scrape_remoteok(self, keywords: str, max_jobs: int) -> List[JobPosting]:
+        try:
+            logger.info("Scraping RemoteOK...")
+            url = "https://remoteok.com/api"
+            headers = {'User-Agent': self.get_random_user_agent()}
+            
+            data = await self._fetch_json(url, headers)
+            return await self._parse_off_loop(self._parse_remoteok, data, keywords, max_jobs)
+        except Exception as e:
+            logger.error(f"Error scraping RemoteOK: {e}")
+            return []
+
+    def _parse_remoteok(self, data, keywords: str, max_jobs: int) -> List[JobPosting]:
+        """Turn the RemoteOK API payload into job postings."""
+        jobs = []
+        query = self._prepare_query(keywords)
+        now = datetime.now()  # One timestamp for every posting on the page
+        # Skip first item (metadata)
+        job_data = data[1:] if isinstance(data, list) and len(data) > 1 else data
+        
+        for job in job_data:
+            # The API returns every open job; stop as soon as there are enough instead of walking the rest
+            if len(jobs) >= max_jobs:
+                break
+            if not isinstance(job, dict):
+                continue
+            
+            title = job.get('position', '').strip()
+            company = job.get('company', '').strip()
+            description = job.get('description', '').strip()
+            
+            if not title or not company:
+                continue
+            
+            # Calculate relevance
+            analysis = _JobAnalysis(title, company, description)
+            relevance = self.calculate_relevance_score(analysis.job_text_lower, query)
+            
+            # Only include relevant jobs
+            if relevance < 20:
+                continue
+            
+            # Extract salary
+            salary_min = job.get('salary_min')
+            salary_max = job.get('salary_max')
+            salary_range = None
+            if salary_min and salary_max:
+                salary_range = f"${salary_min:,} - ${salary_max:,}"
+            
+            job_posting = JobPosting(
+                id=f"remoteok_{job.get('id', len(jobs))}",
+                title=title,
+                company=company,
+                location='Remote',
+                description=self.clean_text(description),
+                requirements=job.get('tags', [])[:5] if job.get('tags') else [],
+                technologies=self.extract_technologies(analysis.job_text_lower),
+                salary_range=salary_range,
+                experience_level=self.detect_experience_level(analysis.title_lower, analysis.description_lower),
+                remote_friendly=True,
+                visa_sponsorship=self.detect_visa_sponsorship(analysis.description_lower),
+                posted_date=parse_date_flexible(job.get('date'), now),
+                source='RemoteOK',
+                url=job.get('url', ''),
+                relevance_score=relevance,
+                job_type='Full-time',
+                benefits=['Remote work', 'Flexible hours']
+            )
+            jobs.append(job_posting)
+        
+        return jobs
+
+    async def scrape_linkedin(self, keywords: str, location: str = "", max_jobs: int = 10) -> List[JobPosting]:
+        """Scrape LinkedIn jobs (limited without login)."""
+        return await self._cached_scrape(('LinkedIn', keywords, location, max_jobs), self._scrape_linkedin, keywords, location, max_jobs)
+
+    async def _scrape_linkedin(self, keywords: str, location: str, max_jobs: int) -> List[JobPosting]:
+        try:
+            logger.info("Scraping LinkedIn jobs...")
+            
+            # LinkedIn public job search URL
+            params = {
+                'keywords': keywords,
+                'location': location or 'United States',
+                'f_TPR': 'r86400',  # Past 24 hours
+                'position': 1,
+                'pageNum': 0
+            }
+            
+            base_url = 'https://www.linkedin.com/jobs/search'
+            url = f"{base_url}?{urlencode(params)}"
+            
+            headers = {
+                'User-Agent': self.get_random_user_agent(),
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Upgrade-Insecure-Requests': '1'
+            }
+            
+            page, charset = await self._fetch_page(url, headers)
+            return await self._parse_off_loop(self._parse_linkedin, page, charset, keywords, location, max_jobs)
+        except Exception as e:
+            logger.error(f"Error scraping LinkedIn: {e}")
+            return []
+
+    def _parse_linkedin(self, page: bytes, charset: str, keywords: str, location: str, max_jobs: int) -> List[JobPosting]:
+        """Parse a LinkedIn search results page into job postings."""
+        jobs = []
+        if not page.strip():
+            return jobs
+        query = self._prepare_query(keywords)
+        now = datetime.now()  # One timestamp for every posting on the page
+        # lxml decodes the raw bytes itself and builds its C tree directly, far cheaper than a BeautifulSoup tree
+        try:
+            parser = lxml_html.HTMLParser(encoding=charset)
+        except LookupError:
+            # libxml2 doesn't know every name Python does (e.g. 'latin-1'), so decode those in Python
+            page, parser = page.decode(charset, 'replace'), None
+        root = lxml_html.document_fromstring(page, parser=parser)
+        job_cards = _LINKEDIN_CARDS(root)[:max_jobs]
+        
+        for i, card in enumerate(job_cards):
+            try:
+                # Extract job details
+                title_elem = _first(_LINKEDIN_TITLE, card)
+                company_elem = _first(_LINKEDIN_COMPANY, card)
+                location_elem = _first(_LINKEDIN_LOCATION, card)
+                link_elem = _first(_LINKEDIN_LINK, card)
+                
+                if title_elem is None or company_elem is None or link_elem is None:
+                    continue
+                
+                title = title_elem.text_content().strip()
+                company = company_elem.text_content().strip()
+                job_location = location_elem.text_content().strip() if location_elem is not None else location
+                job_url = link_elem.get('href', '')
+                
+                # Create job description from available info
+                description = f"{title} position at {company} in {job_location}. "
+                
+                # Extract any additional metadata
+                metadata_elem = _first(_LINKEDIN_METADATA, card)
+                if metadata_elem is not None:
+                    description += metadata_elem.text_content().strip()
+                
+                analysis = _JobAnalysis(title, company, description, job_location)
+                relevance = self.calculate_relevance_score(analysis.job_text_lower, query)
+                
+                # Score before anything else is extracted, so rejected cards cost only the fields scoring needs
+                if relevance < 15:
+                    continue
+                
+                # Extract time posted
+                time_elem = card.find('.//time')
+                posted_date = parse_date_flexible(time_elem.get('datetime', '') if time_elem is not None else '', now)
+                
+                technologies = self.extract_technologies(analysis.job_text_lower)
+                
+                job_posting = JobPosting(
+                    id=f"linkedin_{_url_id(job_url)}",
+                    title=title,
+                    company=company,
+                    location=job_location,
+                    description=self.clean_text(description),
+                    requirements=technologies[:5],
+                    technologies=technologies,
+                    salary_range=self.extract_salary_range(description),
+                    experience_level=self.detect_experience_level(analysis.title_lower, analysis.description_lower),
+                    remote_friendly=self.detect_remote_friendly(analysis.location_lower, analysis.description_lower),
+                    visa_sponsorship=self.detect_visa_sponsorship(analysis.description_lower),
+                    posted_date=posted_date,
+                    source='LinkedIn',
+                    url=job_url,
+                    relevance_score=relevance,
+                    job_type=self.detect_job_type(analysis.description_lower),
+                    benefits=self.extract_benefits(analysis.description_lower)
+                )
+                jobs.append(job_posting)
+                
+            except Exception as e:
+                logger.debug(f"Error parsing LinkedIn job card: {e}")
+                continue
+        
+        return jobs
+
+    async def scrape_indeed(self, keywords: str, location: str = "", max_jobs: int = 10) -> List[JobPosting]:
+        """Scrape Indeed jobs."""
+        return await self._cached_scrape(('Indeed', keywords, location, max_jobs), self._scrape_indeed, keywords, location, max_jobs)
+
+    async def _scrape_indeed(self, keywords: str, location: str, max_jobs: int) -> List[JobPosting]:
+        try:
+            logger.info("Scraping Indeed jobs...")
+            
+            # Indeed search URL
+            params = {
+                'q': keywords,
+                'l': location or 'United States',
+                'fromage': '7',  # Jobs from last 7 days
+                'sort': 'date'
+            }
+            
+            url = f"https://www.indeed.com/jobs?{urlencode(params)}"
+            
+            headers = {
+                'User-Agent': self.get_random_user_agent(),
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+            }
+            
+            page = await self._fetch_text(url, headers)
+            return await self._parse_off_loop(self._parse_indeed, page, url, keywords, location, max_jobs)
+        except Exception as e:
+            logger.error(f"Error scraping Indeed: {e}")
+            return []
+
+    def _parse_indeed(self, page: str, url: str, keywords: str, location: str, max_jobs: int) -> List[JobPosting]:
+        """Parse an Indeed search results page into job postings."""
+        jobs = []
+        query = self._prepare_query(keywords)
+        now = datetime.now()  # One timestamp for every posting on the page
+        # Only card divs (with everything inside them) make it into the tree; nav, scripts and footer are dropped while parsing
+        soup = BeautifulSoup(page, 'lxml', parse_only=_INDEED_CARD_STRAINER)
+        
+        # Indeed uses different class names periodically, try multiple selectors
+        job_cards = soup.find_all('div', class_='job_seen_beacon') or \
+                   soup.find_all('div', class_='jobsearch-SerpJobCard') or \
+                   soup.find_all('div', class_='slider_container')
+        
+        job_cards = job_cards[:max_jobs]
+        
+        for i, card in enumerate(job_cards):
+            try:
+                index = _CardIndex(card)
+                # Extract job details with multiple selector attempts
+                title_elem = index.find('h2', class_='jobTitle') or \
+                            index.find('a', {'data-testid': 'job-title'}) or \
+                            index.find('span', {'title': True})
+                
+                company_elem = index.find('div', {'data-testid': 'company-name'}) or \
+                              index.find('span', class_='companyName') or \
+                              index.find('a', {'data-testid': 'company-name'})
+                
+                location_elem = index.find('div', {'data-testid': 'job-location'}) or \
+                               index.find('div', class_='locationsContainer') or \
+                               index.find('span', class_='location')
+                
+                if not title_elem:
+                    continue
+                
+                title = title_elem.text.strip()
+                company = company_elem.text.strip() if company_elem else 'Company'
+                job_location = location_elem.text.strip() if location_elem else location
+                
+                # Extract snippet/description
+                snippet_elem = index.find('div', class_='job-snippet') or \
+                              index.find('div', {'class': 'summary'}) or \
+                              index.find('div', {'data-testid': 'job-snippet'})
+                
+                description = snippet_elem.text.strip() if snippet_elem else f"{title} at {company}"
+                
+                analysis = _JobAnalysis(title, company, description, job_location)
+                relevance = self.calculate_relevance_score(analysis.job_text_lower, query)
+                
+                # Only cards that pass get their URL, salary and date looked up
+                if relevance < 15:
+                    continue
+                
+                # Extract job URL
+                link_elem = index.find('a', {'class': 'jcs-JobTitle'}) or \
+                           index.find('a', {'data-testid': 'job-title'}) or \
+                           index.find('a', href=True)
+                
+                if link_elem and link_elem.get('href'):
+                    job_url = f"https://www.indeed.com{link_elem['href']}" if link_elem['href'].startswith('/') else link_elem['href']
+                else:
+                    job_url = url
+                
+                # Extract salary if available
+                salary_elem = index.find('div', class_='salary-snippet') or \
+                             index.find('span', class_='salary')
+                salary = salary_elem.text.strip() if salary_elem else None
+                
+                # Extract posted date
+                date_elem = index.find('span', class_='date') or \
+                           index.find('span', {'data-testid': 'job-posted-date'})
+                posted_date = parse_date_flexible(date_elem.text.strip() if date_elem else '', now)
+                
+                technologies = self.extract_technologies(analysis.job_text_lower)
+                
+                job_posting = JobPosting(
+                    id=f"indeed_{_url_id(job_url)}",
+                    title=title,
+                    company=company,
+                    location=job_location,
+                    description=self.clean_text(description),
+                    requirements=technologies[:5],
+                    technologies=technologies,
+                    salary_range=salary or self.extract_salary_range(description),
+                    experience_level=self.detect_experience_level(analysis.title_lower, analysis.description_lower),
+                    remote_friendly=self.detect_remote_friendly(analysis.location_lower, analysis.description_lower),
+                    visa_sponsorship=self.detect_visa_sponsorship(analysis.description_lower),
+                    posted_date=posted_date,
+                    source='Indeed',
+                    url=job_url,
+                    relevance_score=relevance,
+                    job_type=self.detect_job_type(analysis.description_lower),
+                    benefits=self.extract_benefits(analysis.description_lower)
+                )
+                jobs.append(job_posting)
+                
+            except Exception as e:
+                logger.debug(f"Error parsing Indeed job card: {e}")
+                continue
+        
+        return jobs
+
+    async def scrape_sources(self, keywords: str, location: str = "") -> AsyncIterator[Tuple[str, List[JobPosting]]]:
+        """Scrape all real sources concurrently, yielding (source, jobs) as each one finishes."""
+        logger.info(f"Starting REAL job search for: {keywords}, Location: {location if location else 'Any'}")
+        
+        async def scrape(source, start):
+            # A failing source yields no jobs instead of aborting the others.
+            # The scraper coroutine is only created here, so a scrape that never starts leaves nothing unawaited.
+            try:
+                return source, await start()
+            except Exception as e:
+                logger.error(f"Error scraping {source}: {e}")
+                return source, []
+        
+        scrapes = [
+            scrape('LinkedIn', partial(self.scrape_linkedin, keywords, location, max_jobs=10)),  # target: ~10 jobs
+            scrape('Indeed', partial(self.scrape_indeed, keywords, location, max_jobs=10)),  # target: ~10 jobs
+            scrape('RemoteOK', partial(self.scrape_remoteok, keywords, max_jobs=5)),  # API - target: ~5 jobs
+        ]
+        tasks = [asyncio.create_task(scrape) for scrape in scrapes] if self.parallelism > 1 else []
+        try:
+            for finished in (asyncio.as_completed(tasks) if tasks else scrapes):
+                source, jobs = await finished
+                logger.info(f"Scraped {len(jobs)} jobs from {source}.")
+                yield source, jobs
+        finally:
+            # A cancelled or abandoned search stops its remaining scrapes rather than leaving them running
+            for task in tasks:
+                task.cancel()
+            for scrape in scrapes if not tasks else ():
+                scrape.close()
+
+    def rank_jobs(self, all_jobs: List[JobPosting], max_total: int = 25) -> List[JobPosting]:
+        """Deduplicate, filter and sort scraped jobs by relevance."""
+        # Deduplicate jobs, keeping (rank, job) per key
+        unique_jobs_dict = {}
+        for job in all_jobs:
+            # Title, company, location and source; source too, for more precise deduplication
+            key = job.dedup_key
+            
+            # Prioritize jobs with higher relevance, then the more complete (longer, or any) URL
+            rank = (job.relevance_score, len(job.url))
+            if key not in unique_jobs_dict or rank > unique_jobs_dict[key][0]:
+                unique_jobs_dict[key] = (rank, job)
+        
+        # Filter out jobs with zero relevance (indicates conflicting terms)
+        unique_jobs = (job for _, job in unique_jobs_dict.values() if job.relevance_score > 0)
+        
+        # Top jobs by relevance score, up to max_total; same order as a stable full sort, without sorting everything
+        final_jobs = heapq.nlargest(max_total, unique_jobs, key=lambda x: x.relevance_score)
+        logger.info(f"Returning {len(final_jobs)} real jobs after deduplication and sorting.")
+        
+        return final_jobs
+
+    async def scrape_all_sources(self, keywords: str, location: str = "", max_total: int = 25) -> List[JobPosting]:
+        """Scrape from specified real sources only."""
+        all_jobs = []
+        
+        try:
+            async for source, jobs in self.scrape_sources(keywords, location):
+                all_jobs.extend(jobs)
+            
+            logger.info(f"Scraped a total of {len(all_jobs)} potential jobs from all real sources.")
+            
+        except Exception as e:
+            logger.error(f"Error in main scraping loop: {e}")
+        
+        return self.rank_jobs(all_jobs, max_total)
+
+    async def search_jobs_async(self, keywords: str, location: str = "", max_results: int = 25) -> List[Dict]:
+        """
+        Main method to search for jobs across all sources.
+        """
+        try:
+            # Get jobs from all sources
+            jobs = await self.scrape_all_sources(
+                keywords=keywords,
+                location=location,
+                max_total=max_results
+            )
+            
+            # Convert to dictionaries for JSON response
+            return [job.to_dict() for job in jobs]
+            
+        except Exception as e:
+            logger.error(f"Error in search_jobs: {str(e)}")
+            return []
+
+    def search_jobs(self, keywords: str, location: str = "", max_results: int = 25) -> List[Dict]:
+        """Blocking wrapper around search_jobs_async for scripts outside an event loop."""
+        async def run(scraper):
+            try:
+                return await scraper.search_jobs_async(keywords, location, max_results)
+            finally:
+                await scraper.close()
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run(self))
+        
+        # asyncio.run can't nest inside a running loop, so give the search its own loop on a worker thread.
+        # The caller still waits for it; async code should await search_jobs_async instead.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper-sync") as executor:
+            return executor.submit(asyncio.run, run(self._detached())).result()
+
+    def save_jobs_to_file(self, jobs: List[Dict], filename: str = "jobs.json"):
+        """Save jobs to JSON file with proper formatting."""
+        try:
+            # orjson writes UTF-8 bytes directly (non-ASCII kept as-is, like ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(jobs, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            logger.info(f"Saved {len(jobs)} jobs to {filename}")
+        except Exception as e:
+            logger.error(f"Error saving jobs to file: {e}")
+
+    def format_jobs_for_display(self, jobs: List[Dict]) -> str:
+        """Format jobs for console display."""
+        output = []
+        output.append(f"\n{'='*80}")
+        output.append(f"Found {len(jobs)} jobs")
+        output.append(f"{'='*80}\n")
+        
+        for i, job in enumerate(jobs, 1):
+            output.append(f"{i}. {job['title']} at {job['company']}")
+            output.append(f"   Location: {job['location']}")
+            output.append(f"   Experience: {job['experience_level']}")
+            if job.get('salary_range'):
+                output.append(f"   Salary: {job['salary_range']}")
+            output.append(f"   Source: {job['source']}")
+            output.append(f"   Relevance: {job['relevance_score']}%")
+            if job.get('technologies'):
+                output.append(f"   Technologies: {', '.join(job['technologies'][:5])}")
+            output.append(f"   URL: {job['url']}")
+            output.append("")
+        
+        return "\n".join(output)
+
+
+# Example usage
+if __name__ == "__main__":
+    # Initialize the scraper
+    scraper = JobScraper()
+    
+    # Example searches
+    print("Starting job search examples...\n")
+    
+    # Search 1: Python developer jobs
+    print("Searching for Python Developer jobs...")
+    python_jobs = scraper.search_jobs("python developer", "Remote", max_results=15)
+    print(scraper.format_jobs_for_display(python_jobs[:5]))
+    scraper.save_jobs_to_file(python_jobs, "python_jobs.json")
+    
+    print("\n" + "="*80 + "\n")
+    
+    # Search 2: Data scientist jobs
+    print("Searching for Data Scientist jobs...")
+    data_jobs = scraper.search_jobs("data scientist", "San Francisco", max_results=10)
+    print(scraper.format_jobs_for_display(data_jobs[:3]))
+    scraper.save_jobs_to_file(data_jobs, "data_scientist_jobs.json")
+    
+    print("\n" + "="*80 + "\n")
+    
+    # Search 3: React developer jobs
+    print("Searching for React Developer jobs...")
+    react_jobs = scraper.search_jobs("react developer", "", max_results=10)
+    print(scraper.format_jobs_for_display(react_jobs[:3]))
+    scraper.save_jobs_to_file(react_jobs, "react_jobs.json")
+    
     print("\nJob search completed!")
\ No newline at end of file
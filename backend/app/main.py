@@ -1,352 +1,732 @@
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, Response
-from pydantic import BaseModel
-from typing import List, Dict, Optional
-import json
-import os
-from datetime import datetime
-from .job_scraper import JobScraper
-from .latex_service import LaTeXService
-from .ai_service import AIService
-import io
-
-app = FastAPI(
-    title="Easy Apply API",
-    description="API for job scraping and AI-powered application assistance.",
-    version="0.2.0"
-)
-
-# Configure CORS
-origins = [
-    "http://localhost:3000", # React frontend
-    "http://localhost:5173", # Vite React frontend
-    # Add any other origins as needed
-]
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Initialize services
-job_scraper = JobScraper()
-latex_service = LaTeXService()
-ai_service = AIService()
-
-class JobSearchParams(BaseModel):
-    keywords: str
-    location: Optional[str] = None
-
-class Job(BaseModel):
-    id: str
-    title: str
-    company: str
-    location: str
-    type: str
-    description: str
-    requirements: List[str]
-    source: str
-
-class DocumentRequest(BaseModel):
-    job_description: str
-    user_info: dict
-
-@app.get("/")
-async def read_root():
-    return {"message": "Welcome to the Job Search API"}
-
-@app.get("/jobs/search", response_model=List[Dict])
-async def search_jobs(
-    keywords: str = Query(..., description="Keywords to search for jobs (e.g., python developer)"),
-    location: Optional[str] = Query(None, description="Location to search for jobs (e.g., Remote, London)"),
-    max_results: int = Query(25, description="Maximum number of results to return", ge=1, le=50)
-):
-    """
-    Search for jobs using various criteria.
-    The job scraper will attempt to find jobs from LinkedIn, Indeed, and RemoteOK.
-    Results are deduplicated and sorted by relevance.
-    """
-    try:
-        print(f"Received search request: Keywords='{keywords}', Location='{location}', MaxResults={max_results}")
-        # Pass parameters to the scraper method
-        jobs = job_scraper.search_jobs(
-            keywords=keywords, 
-            location=location, 
-            max_results=max_results
-        )
-        if not jobs:
-            print("No jobs found by scraper.")
-        return jobs
-    except Exception as e:
-        print(f"Error during job search: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to search jobs: {str(e)}")
-
-@app.post("/jobs/generate-resume")
-async def generate_resume(request: DocumentRequest):
-    try:
-        # Debug logging
-        print(f"Received user_info type: {type(request.user_info)}")
-        print(f"Received user_info: {request.user_info}")
-        
-        # Ensure user_info is a dict
-        user_info = request.user_info
-        if isinstance(user_info, str):
-            import json
-            try:
-                user_info = json.loads(user_info)
-            except:
-                user_info = {"resume": user_info}
-        
-        # Extract structured information from resume text if available
-        extracted_info = {}
-        resume_text = user_info.get('resume', '')
-        if resume_text and hasattr(ai_service, 'extract_resume_info'):
-            try:
-                print("Extracting structured info from resume text...")
-                extracted_info = ai_service.extract_resume_info(resume_text)
-                print(f"Extracted info keys: {list(extracted_info.keys())}")
-            except Exception as e:
-                print(f"Failed to extract resume info: {e}")
-                extracted_info = {}
-        
-        # Merge all data sources with priority: user_info > linkedin_data > extracted_info
-        parsed_user_info = {
-            'full_name': user_info.get('full_name') or user_info.get('name') or extracted_info.get('full_name', 'Your Name'),
-            'email': user_info.get('email') or extracted_info.get('email', 'email@example.com'),
-            'phone': user_info.get('phone') or extracted_info.get('phone', ''),
-            'linkedin': user_info.get('linkedin') or extracted_info.get('linkedin', ''),
-            'github': user_info.get('github') or extracted_info.get('github', ''),
-            'address': user_info.get('address') or extracted_info.get('address', ''),
-            'summary': user_info.get('summary') or extracted_info.get('summary', ''),
-            'education': user_info.get('education') or extracted_info.get('education', []),
-            'experience': user_info.get('experience') or extracted_info.get('experience', []),
-            'skills': user_info.get('skills') or extracted_info.get('skills', {}),
-            'projects': user_info.get('projects') or extracted_info.get('projects', []),
-            'certifications': user_info.get('certifications') or extracted_info.get('certifications', []),
-            'resume': resume_text
-        }
-        
-        # Process LinkedIn data if available
-        linkedin_data = user_info.get('linkedin_data', {})
-        if linkedin_data:
-            # Override with LinkedIn data where available
-            if linkedin_data.get('name'):
-                parsed_user_info['full_name'] = linkedin_data['name']
-            if linkedin_data.get('headline'):
-                parsed_user_info['linkedin_headline'] = linkedin_data['headline']
-            # Add more LinkedIn fields as needed
-        
-        # Get job-specific customizations from AI
-        ai_customized_content = {}
-        target_job = user_info.get('target_job', {})
-        
-        # Generate a tailored professional summary
-        if hasattr(ai_service, 'generate_professional_summary'):
-            try:
-                print("Generating tailored professional summary...")
-                tailored_summary = ai_service.generate_professional_summary(
-                    parsed_user_info,
-                    request.job_description,
-                    target_job.get('company', 'the company')
-                )
-                ai_customized_content['summary'] = tailored_summary
-                print(f"Generated summary: {tailored_summary[:100]}...")
-            except Exception as e:
-                print(f"Failed to generate professional summary: {e}")
-        
-        # If no AI summary, try to extract from customized resume
-        if not ai_customized_content.get('summary') and hasattr(ai_service, 'customize_resume') and resume_text:
-            try:
-                customized_text = ai_service.customize_resume(
-                    resume_text,
-                    request.job_description
-                )
-                
-                # Extract a professional summary tailored to this job
-                if isinstance(customized_text, str):
-                    lines = customized_text.split('\n')
-                    # Find a summary or objective section
-                    for i, line in enumerate(lines):
-                        if 'summary' in line.lower() or 'objective' in line.lower():
-                            if i + 1 < len(lines):
-                                ai_customized_content['summary'] = lines[i + 1].strip()
-                                break
-                    if not ai_customized_content.get('summary') and lines:
-                        ai_customized_content['summary'] = lines[0].strip()
-            except Exception as e:
-                print(f"AI customization failed: {e}")
-        
-        print(f"Final parsed_user_info keys: {list(parsed_user_info.keys())}")
-        print(f"AI customized content: {ai_customized_content}")
-        
-        # Generate LaTeX resume
-        try:
-            latex_content = latex_service.generate_resume_latex(
-                user_info=parsed_user_info,
-                job_specific_content=ai_customized_content
-            )
-        except Exception as latex_error:
-            print(f"LaTeX generation error: {latex_error}")
-            print(f"Error type: {type(latex_error)}")
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}")
-            raise latex_error
-        
-        # Compile to PDF
-        pdf_bytes = latex_service.compile_latex_to_pdf(latex_content)
-        
-        # Return PDF as response
-        return Response(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=resume_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            }
-        )
-    except Exception as e:
-        # If LaTeX compilation fails, try fallback method
-        if "LaTeX compiler" in str(e) or "LaTeX compilation failed" in str(e):
-            try:
-                print(f"LaTeX compilation failed, using fallback: {e}")
-                pdf_bytes = latex_service.generate_pdf_fallback(parsed_user_info, 'resume')
-                return Response(
-                    content=pdf_bytes,
-                    media_type="application/pdf",
-                    headers={
-                        "Content-Disposition": f"attachment; filename=resume_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-                    }
-                )
-            except Exception as fallback_error:
-                print(f"Fallback PDF generation also failed: {fallback_error}")
-                raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(fallback_error)}")
-        else:
-            print(f"Error generating resume: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to generate resume: {str(e)}")
-
-@app.post("/jobs/generate-cover-letter")
-async def generate_cover_letter(request: DocumentRequest):
-    try:
-        # Debug logging
-        print(f"Received user_info type: {type(request.user_info)}")
-        
-        # Ensure user_info is a dict
-        user_info = request.user_info
-        if isinstance(user_info, str):
-            import json
-            try:
-                user_info = json.loads(user_info)
-            except:
-                user_info = {"resume": user_info}
-        
-        # Extract structured information from resume text if available
-        extracted_info = {}
-        resume_text = user_info.get('resume', '')
-        if resume_text and hasattr(ai_service, 'extract_resume_info'):
-            try:
-                print("Extracting structured info from resume text for cover letter...")
-                extracted_info = ai_service.extract_resume_info(resume_text)
-            except Exception as e:
-                print(f"Failed to extract resume info: {e}")
-                extracted_info = {}
-        
-        # Merge all data sources
-        parsed_user_info = {
-            'full_name': user_info.get('full_name') or user_info.get('name') or extracted_info.get('full_name', 'Your Name'),
-            'email': user_info.get('email') or extracted_info.get('email', 'email@example.com'),
-            'phone': user_info.get('phone') or extracted_info.get('phone', ''),
-            'address': user_info.get('address') or extracted_info.get('address', 'Your Address'),
-            'linkedin': user_info.get('linkedin') or extracted_info.get('linkedin', ''),
-            'github': user_info.get('github') or extracted_info.get('github', ''),
-            'experience': user_info.get('experience') or extracted_info.get('experience', []),
-            'skills': user_info.get('skills') or extracted_info.get('skills', {}),
-            'resume': resume_text
-        }
-        
-        # Process LinkedIn data if available
-        linkedin_data = user_info.get('linkedin_data', {})
-        if linkedin_data and linkedin_data.get('name'):
-            parsed_user_info['full_name'] = linkedin_data['name']
-        
-        # Get target job info
-        target_job = user_info.get('target_job', {})
-        
-        # Extract job info
-        job_info = {
-            'title': target_job.get('title') or request.job_description.split('\n')[0] if request.job_description else 'Position',
-            'company': target_job.get('company') or user_info.get('target_company', 'Company')
-        }
-        
-        # Generate cover letter content using AI with full context
-        cover_letter_content = "I am writing to express my strong interest in this position..."
-        if hasattr(ai_service, 'generate_cover_letter') and parsed_user_info.get('resume'):
-            try:
-                # Create an enhanced prompt with all user info
-                enhanced_resume = f"""
-                Name: {parsed_user_info['full_name']}
-                Email: {parsed_user_info['email']}
-                Phone: {parsed_user_info['phone']}
-                
-                Experience: {len(parsed_user_info.get('experience', []))} positions
-                Key Skills: {', '.join(list(parsed_user_info.get('skills', {}).values())[0][:5]) if parsed_user_info.get('skills') else 'Various technical skills'}
-                
-                Full Resume:
-                {parsed_user_info['resume']}
-                """
-                
-                cover_letter_content = ai_service.generate_cover_letter(
-                    enhanced_resume,
-                    request.job_description,
-                    job_info['company']
-                )
-            except Exception as e:
-                print(f"AI cover letter generation failed: {e}")
-        
-        # Generate LaTeX cover letter
-        latex_content = latex_service.generate_cover_letter_latex(
-            user_info=parsed_user_info,
-            job_info=job_info,
-            cover_letter_content=cover_letter_content
-        )
-        
-        # Compile to PDF
-        pdf_bytes = latex_service.compile_latex_to_pdf(latex_content)
-        
-        # Return PDF as response
-        return Response(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=cover_letter_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            }
-        )
-    except Exception as e:
-        # If LaTeX compilation fails, try fallback method
-        if "LaTeX compiler" in str(e) or "LaTeX compilation failed" in str(e):
-            try:
-                print(f"LaTeX compilation failed, using fallback: {e}")
-                pdf_bytes = latex_service.generate_pdf_fallback({
-                    'user_info': parsed_user_info,
-                    'job_info': job_info,
-                    'content': cover_letter_content
-                }, 'cover_letter')
-                return Response(
-                    content=pdf_bytes,
-                    media_type="application/pdf",
-                    headers={
-                        "Content-Disposition": f"attachment; filename=cover_letter_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-                    }
-                )
-            except Exception as fallback_error:
-                print(f"Fallback PDF generation also failed: {fallback_error}")
-                raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(fallback_error)}")
-        else:
-            print(f"Error generating cover letter: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to generate cover letter: {str(e)}")
-
-if __name__ == "__main__":
-    import uvicorn
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse, Response, FileResponse, ORJSONResponse
+from pydantic import BaseModel
+from typing import List, Dict, Optional, Tuple
+import asyncio
+from contextlib import asynccontextmanager
+import hashlib
+import json
+import orjson
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from .job_scraper import JobScraper
+from .latex_service import LaTeXService
+from .ai_service import AIService
+import io
+
+app = FastAPI(
+    title="Easy Apply API",
+    description="API for job scraping and AI-powered application assistance.",
+    version="0.2.0",
+    # Job lists can be large; orjson serializes them several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse
+)
+
+# Configure CORS
+origins = [
+    "http://localhost:3000", # React frontend
+    "http://localhost:5173", # Vite React frontend
+    # Add any other origins as needed
+]
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=origins,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=["Content-Location", "ETag"],
+)
+
+class PathGZipMiddleware:
+    """GZip responses for the listed JSON endpoints only; SSE streams and PDFs pass through as-is."""
+    def __init__(self, app, paths, minimum_size: int = 1000):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            await self.gzip_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+# Job lists and generated text compress well; everything else is streamed or already compressed
+app.add_middleware(PathGZipMiddleware, paths=["/jobs/search", "/jobs/generate-all"])
+
+# Initialize services
+job_scraper = JobScraper()
+latex_service = LaTeXService()
+ai_service = AIService()
+
+@app.on_event("startup")
+async def probe_latex():
+    latex_info = await asyncio.to_thread(latex_service.probe_latex)
+    print(f"LaTeX available: {latex_info['available']} ({', '.join(latex_info['compilers']) or 'no compilers found'})")
+    # Warm the TeX install in the background rather than holding up startup
+    _spawn(asyncio.to_thread(latex_service.warm_up))
+
+@app.on_event("shutdown")
+async def close_job_scraper():
+    await job_scraper.close()
+    # Spawned parse processes would otherwise outlive the app and every recycled gunicorn worker
+    await asyncio.to_thread(job_scraper.shutdown_parse_pool)
+
+class JobSearchParams(BaseModel):
+    keywords: str
+    location: Optional[str] = None
+
+class Job(BaseModel):
+    id: str
+    title: str
+    company: str
+    location: str
+    type: str
+    description: str
+    requirements: List[str]
+    source: str
+
+class DocumentRequest(BaseModel):
+    job_description: str
+    user_info: dict
+
+def _parse_user_info(user_info) -> dict:
+    """Accept user_info as a dict or a JSON string; any other text is treated as the resume."""
+    if isinstance(user_info, str):
+        try:
+            return json.loads(user_info)
+        except json.JSONDecodeError:
+            return {"resume": user_info}
+    return user_info
+
+# Profile fields merged from the request and the extracted resume: (field, request keys in priority order, default).
+# Container defaults are factories so no request shares a mutable default.
+_RESUME_FIELDS = (
+    ('full_name', ('full_name', 'name'), 'Your Name'),
+    ('email', ('email',), 'email@example.com'),
+    ('phone', ('phone',), ''),
+    ('linkedin', ('linkedin',), ''),
+    ('github', ('github',), ''),
+    ('address', ('address',), ''),
+    ('summary', ('summary',), ''),
+    ('education', ('education',), list),
+    ('experience', ('experience',), list),
+    ('skills', ('skills',), dict),
+    ('projects', ('projects',), list),
+    ('certifications', ('certifications',), list),
+)
+_COVER_LETTER_FIELDS = (
+    ('full_name', ('full_name', 'name'), 'Your Name'),
+    ('email', ('email',), 'email@example.com'),
+    ('phone', ('phone',), ''),
+    ('address', ('address',), 'Your Address'),
+    ('linkedin', ('linkedin',), ''),
+    ('github', ('github',), ''),
+    ('experience', ('experience',), list),
+    ('skills', ('skills',), dict),
+)
+
+def _merge_user_info(user_info: dict, extracted_info: dict, fields) -> dict:
+    """Take each field from the first non-empty request key, else from the extracted resume."""
+    merged = {}
+    for field, keys, default in fields:
+        value = next((user_info[key] for key in keys if user_info.get(key)), None)
+        if not value:
+            value = extracted_info[field] if field in extracted_info else (default() if callable(default) else default)
+        merged[field] = value
+    return merged
+
+# Generated PDFs are stored here under their content hash so they can be re-fetched
+DOCUMENTS_DIR = os.getenv("DOCUMENTS_DIR", "output")
+# Documents carry applicants' personal details, so the store is bounded: each one expires DOCUMENT_TTL
+# seconds after it was last generated, and the oldest go first once the store passes its size limit
+DOCUMENT_TTL = int(os.getenv("DOCUMENT_TTL", 24 * 3600))
+DOCUMENT_STORE_SIZE_LIMIT = int(os.getenv("DOCUMENT_STORE_SIZE_LIMIT", 64 * 1024 * 1024))
+DOCUMENT_PRUNE_INTERVAL = 60
+# A document id is the hash of its bytes, so the content behind a URL never changes while it exists
+DOCUMENT_CACHE_CONTROL = f"private, max-age={DOCUMENT_TTL}, immutable"
+# Behind nginx, hand document bodies off with X-Accel-Redirect so nginx sendfile()s them
+USE_X_SENDFILE = os.getenv("USE_X_SENDFILE", "").lower() in ("1", "true", "yes")
+X_SENDFILE_LOCATION = os.getenv("X_SENDFILE_LOCATION", "/_documents/")
+_DOCUMENT_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+
+# Strong references to fire-and-forget tasks, which the event loop only holds weakly
+_background_tasks = set()
+
+def _spawn(coro) -> asyncio.Task:
+    """Start coro as a task that may outlive the request that started it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+async def _customize_resume(resume_text: str, job_description: str) -> Optional[str]:
+    """Tailored resume text, or None if the AI call fails."""
+    try:
+        return await asyncio.to_thread(ai_service.customize_resume, resume_text, job_description)
+    except Exception as e:
+        print(f"AI customization failed: {e}")
+        return None
+
+_last_prune = 0.0
+_prune_lock = threading.Lock()
+
+def _prune_documents(now: float):
+    """Delete expired documents, then the oldest ones until the store fits its size limit."""
+    documents = []
+    with os.scandir(DOCUMENTS_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.pdf'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            documents.append((stat.st_mtime, stat.st_size, entry.path))
+    documents.sort(reverse=True)
+    total = 0
+    for mtime, size, path in documents:
+        total += size
+        if now - mtime > DOCUMENT_TTL or total > DOCUMENT_STORE_SIZE_LIMIT:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+def _store_document(pdf_bytes: bytes) -> str:
+    """Write a PDF to the document store and return its content-addressed id."""
+    global _last_prune
+    doc_id = hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest()
+    path = os.path.join(DOCUMENTS_DIR, f"{doc_id}.pdf")
+    try:
+        # Regenerating a document restarts its expiry
+        os.utime(path)
+    except FileNotFoundError:
+        os.makedirs(DOCUMENTS_DIR, exist_ok=True)
+        # A temp file per call: concurrent requests in one worker often produce the same document
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=DOCUMENTS_DIR)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(pdf_bytes)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    # One thread prunes at a time; the others skip rather than wait for it
+    if _prune_lock.acquire(blocking=False):
+        try:
+            now = time.time()
+            if now - _last_prune > DOCUMENT_PRUNE_INTERVAL:
+                _last_prune = now
+                _prune_documents(now)
+        finally:
+            _prune_lock.release()
+    return doc_id
+
+async def _pdf_response(pdf_bytes: bytes, doc_type: str) -> Response:
+    """Return a freshly generated PDF, pointing at its cacheable /documents URL."""
+    headers = {
+        "Content-Disposition": f"attachment; filename={doc_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    }
+    try:
+        doc_id = await asyncio.to_thread(_store_document, pdf_bytes)
+        headers["Content-Location"] = f"/documents/{doc_id}"
+    except OSError as e:
+        print(f"Could not store generated document: {e}")
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
+
+_BYTE_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+DOCUMENT_CHUNK_SIZE = 64 * 1024
+
+def _parse_byte_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Resolve a single-range Range header to inclusive offsets; None means send the whole file."""
+    match = _BYTE_RANGE_RE.match(range_header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    if start >= size or end < start:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
+
+def _iter_file_range(path: str, start: int, end: int):
+    """Read [start, end] from a file in chunks instead of loading it whole."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(DOCUMENT_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+def _etag_matches(if_none_match: str, etag: str, wildcard: bool = True) -> bool:
+    """Check an If-None-Match header value against an ETag; wildcard=False ignores "*"."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return (wildcard and "*" in tags) or etag in tags
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against a document's validators."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+@app.get("/")
+async def read_root():
+    return {"message": "Welcome to the Job Search API"}
+
+@app.get("/latex/status")
+async def latex_status(refresh: bool = Query(False, description="Probe the installed compilers again instead of using the startup result")):
+    """Report the LaTeX compilers found at startup."""
+    if refresh:
+        return await asyncio.to_thread(latex_service.probe_latex, True)
+    return latex_service.probe_latex()
+
+# At most SEARCH_WORKERS searches scrape at once; once SEARCH_QUEUE_LIMIT more are
+# waiting for a slot, new searches are turned away with 503 instead of piling up
+SEARCH_WORKERS = int(os.getenv("SEARCH_WORKERS", "4"))
+SEARCH_QUEUE_LIMIT = int(os.getenv("SEARCH_QUEUE_LIMIT", "16"))
+_search_semaphore = asyncio.Semaphore(SEARCH_WORKERS)
+_searches_waiting = 0
+
+def _check_search_capacity():
+    """Reject a new search with 503 when the waiting queue is already full."""
+    if _search_semaphore.locked() and _searches_waiting >= SEARCH_QUEUE_LIMIT:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many searches in progress, please try again shortly",
+            headers={"Retry-After": "5"}
+        )
+
+@asynccontextmanager
+async def _search_slot():
+    """Hold one of the SEARCH_WORKERS scraping slots for the duration of a search."""
+    global _searches_waiting
+    _check_search_capacity()
+    _searches_waiting += 1
+    try:
+        await _search_semaphore.acquire()
+    finally:
+        _searches_waiting -= 1
+    try:
+        yield
+    finally:
+        _search_semaphore.release()
+
+@app.get("/jobs/search", response_model=List[Dict])
+async def search_jobs(
+    keywords: str = Query(..., description="Keywords to search for jobs (e.g., python developer)"),
+    location: Optional[str] = Query(None, description="Location to search for jobs (e.g., Remote, London)"),
+    max_results: int = Query(25, description="Maximum number of results to return", ge=1, le=50)
+):
+    """
+    Search for jobs using various criteria.
+    The job scraper will attempt to find jobs from LinkedIn, Indeed, and RemoteOK.
+    Results are deduplicated and sorted by relevance.
+    """
+    async with _search_slot():
+        try:
+            print(f"Received search request: Keywords='{keywords}', Location='{location}', MaxResults={max_results}")
+            # Pass parameters to the scraper method
+            jobs = await job_scraper.search_jobs_async(
+                keywords=keywords, 
+                location=location, 
+                max_results=max_results
+            )
+            if not jobs:
+                print("No jobs found by scraper.")
+            return jobs
+        except Exception as e:
+            print(f"Error during job search: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to search jobs: {str(e)}")
+
+# Seconds without a scraper update before a keep-alive comment is sent
+SSE_HEARTBEAT_INTERVAL = 15
+
+def _sse_event(event: str, data) -> str:
+    """Format a Server-Sent Events message."""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+@app.get("/jobs/search/stream")
+async def stream_jobs(
+    keywords: str = Query(..., description="Keywords to search for jobs (e.g., python developer)"),
+    location: Optional[str] = Query(None, description="Location to search for jobs (e.g., Remote, London)"),
+    max_results: int = Query(25, description="Maximum number of results to return", ge=1, le=50)
+):
+    """
+    Stream job search progress as Server-Sent Events.
+    A `progress` event is pushed as soon as each source has been scraped,
+    followed by a single `done` event carrying the deduplicated, sorted results.
+    """
+    print(f"Received streaming search request: Keywords='{keywords}', Location='{location}', MaxResults={max_results}")
+    _check_search_capacity()
+    updates = asyncio.Queue()
+    finished = object()  # Sentinel pushed by the producer once scraping is over
+
+    async def produce():
+        all_jobs = []
+        try:
+            async with _search_slot():
+                async for source, jobs in job_scraper.scrape_sources(keywords, location):
+                    all_jobs.extend(jobs)
+                    await updates.put(('progress', {'source': source, 'jobs': [job.to_dict() for job in jobs]}))
+                final_jobs = job_scraper.rank_jobs(all_jobs, max_results)
+            await updates.put(('done', {'jobs': [job.to_dict() for job in final_jobs]}))
+        except Exception as e:
+            print(f"Error during streaming job search: {e}")
+            await updates.put(('error', {'detail': f"Failed to search jobs: {str(e)}"}))
+        finally:
+            await updates.put(finished)
+
+    async def event_stream():
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(updates.get(), timeout=SSE_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if item is finished:
+                    break
+                yield _sse_event(*item)
+        finally:
+            # Stop scraping if the client went away mid-stream
+            producer.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/jobs/generate-resume")
+async def generate_resume(request: DocumentRequest):
+    try:
+        # Debug logging
+        print(f"Received user_info type: {type(request.user_info)}")
+        print(f"Received user_info: {request.user_info}")
+        
+        # Ensure user_info is a dict
+        user_info = _parse_user_info(request.user_info)
+        
+        # Extract structured information from resume text if available
+        extracted_info = {}
+        resume_text = user_info.get('resume', '')
+        if resume_text and hasattr(ai_service, 'extract_resume_info'):
+            try:
+                print("Extracting structured info from resume text...")
+                extracted_info = await asyncio.to_thread(ai_service.extract_resume_info, resume_text)
+                print(f"Extracted info keys: {list(extracted_info.keys())}")
+            except Exception as e:
+                print(f"Failed to extract resume info: {e}")
+                extracted_info = {}
+        
+        # Merge all data sources with priority: user_info > linkedin_data > extracted_info
+        parsed_user_info = _merge_user_info(user_info, extracted_info, _RESUME_FIELDS)
+        parsed_user_info['resume'] = resume_text
+        
+        # Process LinkedIn data if available
+        linkedin_data = user_info.get('linkedin_data', {})
+        if linkedin_data:
+            # Override with LinkedIn data where available
+            if linkedin_data.get('name'):
+                parsed_user_info['full_name'] = linkedin_data['name']
+            if linkedin_data.get('headline'):
+                parsed_user_info['linkedin_headline'] = linkedin_data['headline']
+            # Add more LinkedIn fields as needed
+        
+        # Get job-specific customizations from AI
+        ai_customized_content = {}
+        target_job = user_info.get('target_job', {})
+        
+        # Generate a tailored professional summary
+        if hasattr(ai_service, 'generate_professional_summary'):
+            try:
+                print("Generating tailored professional summary...")
+                tailored_summary = await asyncio.to_thread(
+                    ai_service.generate_professional_summary,
+                    parsed_user_info,
+                    request.job_description,
+                    target_job.get('company', 'the company')
+                )
+                ai_customized_content['summary'] = tailored_summary
+                print(f"Generated summary: {tailored_summary[:100]}...")
+            except Exception as e:
+                print(f"Failed to generate professional summary: {e}")
+        
+        # If no AI summary, try to extract from customized resume
+        # Only this fallback needs the full customized resume, so it is requested only here
+        if not ai_customized_content.get('summary') and hasattr(ai_service, 'customize_resume') and resume_text:
+            customized_text = await _customize_resume(resume_text, request.job_description)
+            
+            # Extract a professional summary tailored to this job
+            if isinstance(customized_text, str):
+                lines = customized_text.split('\n')
+                # Find a summary or objective section
+                for i, line in enumerate(lines):
+                    if 'summary' in line.lower() or 'objective' in line.lower():
+                        if i + 1 < len(lines):
+                            ai_customized_content['summary'] = lines[i + 1].strip()
+                            break
+                if not ai_customized_content.get('summary') and lines:
+                    ai_customized_content['summary'] = lines[0].strip()
+        
+        print(f"Final parsed_user_info keys: {list(parsed_user_info.keys())}")
+        print(f"AI customized content: {ai_customized_content}")
+        
+        # Generate LaTeX resume
+        try:
+            latex_content = latex_service.generate_resume_latex(
+                user_info=parsed_user_info,
+                job_specific_content=ai_customized_content
+            )
+        except Exception as latex_error:
+            print(f"LaTeX generation error: {latex_error}")
+            print(f"Error type: {type(latex_error)}")
+            import traceback
+            print(f"Traceback: {traceback.format_exc()}")
+            raise latex_error
+        
+        # Compile to PDF
+        pdf_bytes = await asyncio.to_thread(latex_service.compile_latex_to_pdf, latex_content)
+        
+        # Return PDF as response
+        return await _pdf_response(pdf_bytes, 'resume')
+    except Exception as e:
+        # If LaTeX compilation fails, try fallback method
+        if "LaTeX compiler" in str(e) or "LaTeX compilation failed" in str(e):
+            try:
+                print(f"LaTeX compilation failed, using fallback: {e}")
+                pdf_bytes = await asyncio.to_thread(latex_service.generate_pdf_fallback, parsed_user_info, 'resume')
+                return await _pdf_response(pdf_bytes, 'resume')
+            except Exception as fallback_error:
+                print(f"Fallback PDF generation also failed: {fallback_error}")
+                raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(fallback_error)}")
+        else:
+            print(f"Error generating resume: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to generate resume: {str(e)}")
+
+@app.post("/jobs/generate-cover-letter")
+async def generate_cover_letter(request: DocumentRequest):
+    try:
+        # Debug logging
+        print(f"Received user_info type: {type(request.user_info)}")
+        
+        # Ensure user_info is a dict
+        user_info = _parse_user_info(request.user_info)
+        
+        # Extract structured information from resume text if available
+        extracted_info = {}
+        resume_text = user_info.get('resume', '')
+        if resume_text and hasattr(ai_service, 'extract_resume_info'):
+            try:
+                print("Extracting structured info from resume text for cover letter...")
+                extracted_info = await asyncio.to_thread(ai_service.extract_resume_info, resume_text)
+            except Exception as e:
+                print(f"Failed to extract resume info: {e}")
+                extracted_info = {}
+        
+        # Merge all data sources
+        parsed_user_info = _merge_user_info(user_info, extracted_info, _COVER_LETTER_FIELDS)
+        parsed_user_info['resume'] = resume_text
+        
+        # Process LinkedIn data if available
+        linkedin_data = user_info.get('linkedin_data', {})
+        if linkedin_data and linkedin_data.get('name'):
+            parsed_user_info['full_name'] = linkedin_data['name']
+        
+        # Get target job info
+        target_job = user_info.get('target_job', {})
+        
+        # Extract job info
+        job_info = {
+            'title': target_job.get('title') or request.job_description.split('\n')[0] if request.job_description else 'Position',
+            'company': target_job.get('company') or user_info.get('target_company', 'Company')
+        }
+        
+        # Generate cover letter content using AI with full context
+        cover_letter_content = "I am writing to express my strong interest in this position..."
+        if hasattr(ai_service, 'generate_cover_letter') and parsed_user_info.get('resume'):
+            try:
+                # Create an enhanced prompt with all user info
+                enhanced_resume = f"""
+                Name: {parsed_user_info['full_name']}
+                Email: {parsed_user_info['email']}
+                Phone: {parsed_user_info['phone']}
+                
+                Experience: {len(parsed_user_info.get('experience', []))} positions
+                Key Skills: {', '.join(list(parsed_user_info.get('skills', {}).values())[0][:5]) if parsed_user_info.get('skills') else 'Various technical skills'}
+                
+                Full Resume:
+                {parsed_user_info['resume']}
+                """
+                
+                cover_letter_content = await asyncio.to_thread(
+                    ai_service.generate_cover_letter,
+                    enhanced_resume,
+                    request.job_description,
+                    job_info['company']
+                )
+            except Exception as e:
+                print(f"AI cover letter generation failed: {e}")
+        
+        # Generate LaTeX cover letter
+        latex_content = latex_service.generate_cover_letter_latex(
+            user_info=parsed_user_info,
+            job_info=job_info,
+            cover_letter_content=cover_letter_content
+        )
+        
+        # Compile to PDF
+        pdf_bytes = await asyncio.to_thread(latex_service.compile_latex_to_pdf, latex_content)
+        
+        # Return PDF as response
+        return await _pdf_response(pdf_bytes, 'cover_letter')
+    except Exception as e:
+        # If LaTeX compilation fails, try fallback method
+        if "LaTeX compiler" in str(e) or "LaTeX compilation failed" in str(e):
+            try:
+                print(f"LaTeX compilation failed, using fallback: {e}")
+                pdf_bytes = await asyncio.to_thread(latex_service.generate_pdf_fallback, {
+                    'user_info': parsed_user_info,
+                    'job_info': job_info,
+                    'content': cover_letter_content
+                }, 'cover_letter')
+                return await _pdf_response(pdf_bytes, 'cover_letter')
+            except Exception as fallback_error:
+                print(f"Fallback PDF generation also failed: {fallback_error}")
+                raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(fallback_error)}")
+        else:
+            print(f"Error generating cover letter: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to generate cover letter: {str(e)}")
+
+@app.post("/jobs/generate-all")
+async def generate_application_package(request: DocumentRequest):
+    """
+    Generate the tailored resume text, cover letter and job-fit analysis
+    for one job with a single AI request.
+    """
+    user_info = _parse_user_info(request.user_info)
+    
+    resume_text = user_info.get('resume', '')
+    if not resume_text:
+        raise HTTPException(status_code=400, detail="user_info.resume is required")
+    
+    target_job = user_info.get('target_job', {})
+    company = target_job.get('company') or user_info.get('target_company', 'the company')
+    try:
+        return await asyncio.to_thread(ai_service.generate_all, resume_text, request.job_description, company)
+    except Exception as e:
+        print(f"Error generating application package: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to generate application package: {str(e)}")
+
+@app.post("/jobs/customize-resume/stream")
+async def stream_customized_resume(request: DocumentRequest):
+    """
+    Stream the AI-customized resume as Server-Sent Events.
+    `chunk` events carry text as the model generates it, followed by a `done` event.
+    """
+    user_info = _parse_user_info(request.user_info)
+    
+    resume_text = user_info.get('resume', '')
+    if not resume_text:
+        raise HTTPException(status_code=400, detail="user_info.resume is required")
+    
+    def event_stream():
+        try:
+            for content in ai_service.customize_resume_stream(resume_text, request.job_description):
+                yield _sse_event('chunk', {'content': content})
+            yield _sse_event('done', {})
+        except Exception as e:
+            print(f"Error streaming customized resume: {e}")
+            yield _sse_event('error', {'detail': f"Failed to customize resume: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/documents/{doc_id}")
+async def get_document(doc_id: str, request: Request, download: bool = False):
+    """
+    Serve a previously generated PDF.
+    Responses carry ETag/Last-Modified validators so repeat views are answered with 304,
+    and single byte ranges are answered with 206 so viewers can resume or seek.
+    """
+    if not _DOCUMENT_ID_RE.match(doc_id):
+        raise HTTPException(status_code=404, detail="Document not found")
+    etag = f'"{doc_id}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": DOCUMENT_CACHE_CONTROL,
+    }
+    # The id is the content hash, so a matching ETag is answered without touching the disk.
+    # "*" only matches a document that exists, so it waits for the stat below.
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag, wildcard=False):
+        return Response(status_code=304, headers=headers)
+    
+    path = os.path.join(DOCUMENTS_DIR, f"{doc_id}.pdf")
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    if time.time() - stat.st_mtime > DOCUMENT_TTL:
+        # Expired but not pruned yet
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    headers["Last-Modified"] = formatdate(stat.st_mtime, usegmt=True)
+    if _not_modified(request, etag, stat.st_mtime):
+        return Response(status_code=304, headers=headers)
+    headers["Content-Disposition"] = f'{"attachment" if download else "inline"}; filename="{doc_id}.pdf"'
+    if USE_X_SENDFILE:
+        # nginx serves the body, including any Range request, from its internal location
+        headers["X-Accel-Redirect"] = f"{X_SENDFILE_LOCATION}{doc_id}.pdf"
+        return Response(media_type="application/pdf", headers=headers)
+    
+    headers["Accept-Ranges"] = "bytes"
+    range_header = request.headers.get("range")
+    if range_header and request.headers.get("if-range", etag) in (etag, headers["Last-Modified"]):
+        byte_range = _parse_byte_range(range_header, stat.st_size)
+        if byte_range:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _iter_file_range(path, start, end),
+                status_code=206,
+                media_type="application/pdf",
+                headers=headers
+            )
+    return FileResponse(path, media_type="application/pdf", headers=headers)
+
+if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="127.0.0.1", port=8000) 
\ No newline at end of file
@@ -0,0 +1,22 @@
+import multiprocessing
+import os
+
+# Production server: gunicorn -c gunicorn.conf.py app.main:app
+# For local development keep using `python run.py`, which reloads on change.
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count(), 4)))
+# The app is ASGI, so each worker runs an event loop rather than a thread pool
+worker_class = "uvicorn.workers.UvicornWorker"
+# PDF generation (LLM call + LaTeX compile) can take well over the default 30s
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+
+def when_ready(server):
+    """Report LaTeX availability once, before workers start taking requests."""
+    from app.latex_service import LaTeXService
+
+    latex_info = LaTeXService().probe_latex()
+    compilers = ", ".join(latex_info["compilers"]) or "no compilers found"
+    server.log.info(f"LaTeX available: {latex_info['available']} ({compilers})")
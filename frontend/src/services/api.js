@@ -1,83 +1,109 @@
-const API_BASE_URL = 'http://127.0.0.1:8000'
-
-export const jobAPI = {
-  async searchJobs(keywords, location = '') {
-    const queryParams = new URLSearchParams();
-    if (keywords) queryParams.append('keywords', keywords);
-    if (location) queryParams.append('location', location);
-
-    const response = await fetch(
-      `${API_BASE_URL}/jobs/search?${queryParams.toString()}`
-    )
-    if (!response.ok) {
-      throw new Error('Failed to fetch jobs')
-    }
-    return response.json()
-  },
-
-  async generateResume(jobDescription, userInfo) {
-    const response = await fetch(`${API_BASE_URL}/jobs/generate-resume`, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        job_description: jobDescription,
-        user_info: userInfo,
-      }),
-    })
-    if (!response.ok) {
-      throw new Error('Failed to generate resume')
-    }
-    
-    // Return blob for PDF
-    const blob = await response.blob()
-    return {
-      blob: blob,
-      url: URL.createObjectURL(blob)
-    }
-  },
-
-  async generateCoverLetter(jobDescription, companyName, userInfo) {
-    const response = await fetch(`${API_BASE_URL}/jobs/generate-cover-letter`, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        job_description: jobDescription,
-        user_info: {
-          ...userInfo,
-          target_company: companyName
-        },
-      }),
-    })
-    if (!response.ok) {
-      throw new Error('Failed to generate cover letter')
-    }
-    
-    // Return blob for PDF
-    const blob = await response.blob()
-    return {
-      blob: blob,
-      url: URL.createObjectURL(blob)
-    }
-  },
-
-  async analyzeJobFit(jobDescription, userInfo) {
-    const response = await fetch(`${API_BASE_URL}/analyze/job-fit`, {
-      method: 'GET',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        job_description: jobDescription,
-        user_info: userInfo,
-      }),
-    })
-    if (!response.ok) {
-      throw new Error('Failed to analyze job fit')
-    }
-    return response.json()
-  }
+const API_BASE_URL = 'http://127.0.0.1:8000'
+
+export const jobAPI = {
+  async searchJobs(keywords, location = '') {
+    const queryParams = new URLSearchParams();
+    if (keywords) queryParams.append('keywords', keywords);
+    if (location) queryParams.append('location', location);
+
+    const response = await fetch(
+      `${API_BASE_URL}/jobs/search?${queryParams.toString()}`
+    )
+    if (!response.ok) {
+      throw new Error('Failed to fetch jobs')
+    }
+    return response.json()
+  },
+
+  // Streams search progress over Server-Sent Events instead of waiting for
+  // the whole search. onProgress receives each source's jobs as they arrive;
+  // the returned promise resolves with the final, ranked job list.
+  streamJobs(keywords, location = '', onProgress = () => {}) {
+    const queryParams = new URLSearchParams();
+    if (keywords) queryParams.append('keywords', keywords);
+    if (location) queryParams.append('location', location);
+
+    return new Promise((resolve, reject) => {
+      const source = new EventSource(
+        `${API_BASE_URL}/jobs/search/stream?${queryParams.toString()}`
+      )
+      source.addEventListener('progress', (event) => {
+        onProgress(JSON.parse(event.data))
+      })
+      source.addEventListener('done', (event) => {
+        source.close()
+        resolve(JSON.parse(event.data).jobs)
+      })
+      source.addEventListener('error', (event) => {
+        source.close()
+        reject(new Error(event.data ? JSON.parse(event.data).detail : 'Failed to stream jobs'))
+      })
+    })
+  },
+
+  async generateResume(jobDescription, userInfo) {
+    const response = await fetch(`${API_BASE_URL}/jobs/generate-resume`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({
+        job_description: jobDescription,
+        user_info: userInfo,
+      }),
+    })
+    if (!response.ok) {
+      throw new Error('Failed to generate resume')
+    }
+    
+    // Return blob for PDF
+    const blob = await response.blob()
+    return {
+      blob: blob,
+      url: URL.createObjectURL(blob)
+    }
+  },
+
+  async generateCoverLetter(jobDescription, companyName, userInfo) {
+    const response = await fetch(`${API_BASE_URL}/jobs/generate-cover-letter`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({
+        job_description: jobDescription,
+        user_info: {
+          ...userInfo,
+          target_company: companyName
+        },
+      }),
+    })
+    if (!response.ok) {
+      throw new Error('Failed to generate cover letter')
+    }
+    
+    // Return blob for PDF
+    const blob = await response.blob()
+    return {
+      blob: blob,
+      url: URL.createObjectURL(blob)
+    }
+  },
+
+  async analyzeJobFit(jobDescription, userInfo) {
+    const response = await fetch(`${API_BASE_URL}/analyze/job-fit`, {
+      method: 'GET',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({
+        job_description: jobDescription,
+        user_info: userInfo,
+      }),
+    })
+    if (!response.ok) {
+      throw new Error('Failed to analyze job fit')
+    }
+    return response.json()
+  }
 } 
\ No newline at end of file